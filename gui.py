@@ -8,15 +8,21 @@ Features:
 """
 
 import os
+import queue
 import threading
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
 
 from pyv.models.pipelined import PipelinedModel
+from pyv.models.singlecycle import SingleCycleModel
 
 # Import compile_program from main (safe; main has guard)
 import main as simulator_main
 
+# Maximum number of lines kept in the GUI log widget; oldest lines are
+# trimmed past this so Text-widget cost stays bounded on long runs
+MAX_LOG_LINES = 5000
+
 
 class PipelinedGUI(tk.Tk):
     def __init__(self):
@@ -27,14 +33,64 @@ class PipelinedGUI(tk.Tk):
         self.model = None
         self.core = None
         self.running = False
-        self._run_job = None
         self._run_n_remaining = 0
 
+        # Continuous run executes on a background worker thread so the
+        # Tk event loop stays responsive. The worker publishes log lines
+        # through a queue which the UI drains periodically.
+        self._sim_q = queue.Queue()
+        self._sim_stop = threading.Event()
+        self._sim_lock = threading.Lock()
+        self._sim_thread = None
+        self._drain_job = None
+        self._worker_batch = 256  # sim cycles per queue snapshot
+        self._batch_size = 500  # sim cycles per Tk callback for Run N
+
+        # Log lines are buffered and flushed into the Text widget in a
+        # single insert per flush tick (one Tk call instead of one per line)
+        self._log_buf = []
+        self._log_flush_scheduled = False
+
         # State for change-detection and auto-stop
         self._prev_snapshot = None
+        self._last_rendered_snapshot = None
         self._stable_count = 0
         self._stable_threshold = 6  # stop after 6 consecutive cycles with no changes
 
+        # Non-verbose bulk runs accumulate register changes into a bitmask
+        # and log one summary line per window instead of per-cycle diffs.
+        # _suppress_diffs caches (not _verbose_diff) on the main thread so
+        # the worker never has to touch a Tk variable.
+        self._suppress_diffs = False
+        self._summary_interval = 1024  # cycles per summary line
+        self._diff_mask = 0
+        self._diff_window = 0
+
+        # Loop-invariant pieces of the register pane lines, plus the last
+        # rendered line per register so unchanged lines are never rewritten
+        self._reg_prefixes = tuple(f"x{i:02} = 0x" for i in range(16))
+        self._reg_cache = [None] * 16
+
+        # Last text set on each status label; a label is only reconfigured
+        # when its text actually changes
+        self._last_labels = {'pc': None, 'ifid': None, 'ex': None, 'mem': None}
+
+        # Last (pc, inst) pair shown, so stalled PCs skip the memory read
+        self._last_pc_inst = (None, None)
+
+        # Pipeline-empty result memoized on PC; the stop only fires on
+        # the not-empty -> empty transition
+        self._last_pc_for_empty = None
+        self._cached_empty = False
+
+        # Bound model accessors; set up by _bind_accessors after load
+        self._read_pc = None
+        self._read_reg = None
+        self._read_ifid = None
+        self._read_idex = None
+        self._read_exmem = None
+        self._read_memwb = None
+
         # Project root (dir where this file lives) — use for finding programs/run.log
         self.proj_root = os.path.dirname(__file__)
 
@@ -97,6 +153,13 @@ class PipelinedGUI(tk.Tk):
         self.clearlog_btn = ttk.Button(run_ctrl, text="Clear Logs", command=self.clear_logs)
         self.clearlog_btn.pack(side=tk.LEFT, padx=6)
 
+        # Per-cycle diff logging is expensive during long runs; when
+        # disabled, bulk runs only log a compact summary line
+        self._verbose_diff = tk.BooleanVar(value=True)
+        self.verbose_chk = ttk.Checkbutton(run_ctrl, text="Verbose diffs",
+                                           variable=self._verbose_diff)
+        self.verbose_chk.pack(side=tk.LEFT, padx=6)
+
         # Middle frame: pipeline state
         mid = ttk.Frame(self)
         mid.pack(side=tk.TOP, fill=tk.BOTH, expand=True, padx=8, pady=8)
@@ -126,6 +189,9 @@ class PipelinedGUI(tk.Tk):
 
         self.reg_text = scrolledtext.ScrolledText(reg_frame, height=10, width=40, font=("Courier", 10))
         self.reg_text.pack(fill=tk.BOTH, expand=True)
+        # Pre-populate one line per register so update_view can replace
+        # individual lines in place instead of clearing and rebuilding
+        self.reg_text.insert(tk.END, "\n" * 15)
         self.reg_text.config(state=tk.DISABLED)
 
         # Right: log
@@ -143,16 +209,38 @@ class PipelinedGUI(tk.Tk):
             self.log(f"Program directory not found: {prog_dir}")
             self.program_cb['values'] = []
             return
-        progs = [d for d in os.listdir(prog_dir) if os.path.isdir(os.path.join(prog_dir, d)) and d != 'common']
-        progs.sort()
+        # scandir gives is_dir() from the directory read, avoiding a
+        # stat call per entry
+        with os.scandir(prog_dir) as it:
+            progs = sorted(e.name for e in it if e.is_dir() and e.name != 'common')
         self.program_cb['values'] = progs
         if progs:
             self.program_cb.current(0) 
 
     def log(self, text: str):
+        self._log_buf.append(text + "\n")
+        if not self._log_flush_scheduled:
+            self._log_flush_scheduled = True
+            self.after(100, self._flush_log)
+
+    def _flush_log(self):
+        """Flush all buffered log lines with a single Text insert."""
+        self._log_flush_scheduled = False
+        if not self._log_buf:
+            return
+        text = "".join(self._log_buf)
+        self._log_buf.clear()
+        # Only auto-scroll if the user was already at the bottom
+        at_bottom = self.log_text.yview()[1] >= 0.999
         self.log_text.config(state=tk.NORMAL)
-        self.log_text.insert(tk.END, text + "\n")
-        self.log_text.see(tk.END)
+        self.log_text.insert(tk.END, text)
+        # Trim only the oldest excess lines (never a full clear/rebuild)
+        lines = int(self.log_text.index('end-1c').split('.')[0])
+        if lines > MAX_LOG_LINES:
+            excess = lines - MAX_LOG_LINES
+            self.log_text.delete('1.0', f'{excess + 1}.0')
+        if at_bottom:
+            self.log_text.see(tk.END)
         self.log_text.config(state=tk.DISABLED)
 
     def compile_and_load(self):
@@ -177,14 +265,12 @@ class PipelinedGUI(tk.Tk):
         self.log(f"Loading binary: {bin_file}")
 
         # Instantiate selected model
-        sel = self.model_var.get() if hasattr(self, 'model_var') else 'Pipelined'
+        sel = self.model_var.get()
         try:
             if sel == 'Single-cycle' or sel.lower().startswith('single'):
-                from pyv.models.singlecycle import SingleCycleModel
                 self.model = SingleCycleModel()
                 self.log("Using Single-Cycle model")
             else:
-                from pyv.models.pipelined import PipelinedModel
                 self.model = PipelinedModel(verbose=False, interactive=True)
                 self.log("Using Pipelined model")
             self.core = self.model.core
@@ -209,6 +295,14 @@ class PipelinedGUI(tk.Tk):
 
         self.log("Binary loaded into instruction memory")
 
+        # Probe the model once and cache bound accessors for the hot paths
+        self._bind_accessors()
+        # New binary: the memoized (pc, inst) pair and pipeline-empty
+        # state may be stale
+        self._last_pc_inst = (None, None)
+        self._last_pc_for_empty = None
+        self._cached_empty = False
+
         # Initialize snapshot state so we don't log initial state as a "change" on first step
         try:
             self._prev_snapshot = self._snapshot_state()
@@ -230,7 +324,8 @@ class PipelinedGUI(tk.Tk):
             return
         # Single cycle step
         try:
-            self.model.sim.step()
+            with self._sim_lock:
+                self.model.sim.step()
         except Exception as e:
             # Show error and stop continuous run if active
             self.log(f"Error during step: {e}")
@@ -243,27 +338,63 @@ class PipelinedGUI(tk.Tk):
         self.update_view()
 
     def run_loop(self):
+        """Start the background stepping worker and the UI drain loop."""
         if not self.running or not self.model:
             return
+        self._suppress_diffs = not self._verbose_diff.get()
+        self._diff_mask = 0
+        self._diff_window = 0
+        self._sim_stop.clear()
+        self._sim_thread = threading.Thread(target=self._sim_worker, daemon=True)
+        self._sim_thread.start()
+        self._drain_job = self.after(50, self._drain_ui_queue)
+
+    def _sim_worker(self):
+        """Worker thread: step the simulator in tight batches.
+
+        Never touches Tk widgets — all UI output goes through the queue
+        and is applied by _drain_ui_queue on the main thread.
+        """
+        while not self._sim_stop.is_set():
+            lines = []
+            stop_reason = None
+            try:
+                with self._sim_lock:
+                    for _ in range(self._worker_batch):
+                        self.model.sim.step()
+                        batch_lines, stop_reason = self._post_step_lines()
+                        lines.extend(batch_lines)
+                        if stop_reason:
+                            break
+            except Exception as e:
+                stop_reason = f"Error during run: {e}"
+            self._sim_q.put({'lines': lines, 'stop': stop_reason})
+            if stop_reason:
+                break
+
+    def _drain_ui_queue(self):
+        """Apply queued worker output to the UI (main thread only)."""
+        stop_reason = None
         try:
-            self.model.sim.step()
-        except Exception as e:
-            self.log(f"Error during run: {e}")
-            messagebox.showerror("Simulation Error", str(e))
+            while True:
+                snap = self._sim_q.get_nowait()
+                for line in snap['lines']:
+                    self.log(line)
+                if snap['stop']:
+                    stop_reason = snap['stop']
+        except queue.Empty:
+            pass
+
+        self.update_view()
+
+        if stop_reason or self._sim_stop.is_set():
+            if stop_reason:
+                self.log(stop_reason)
             self.running = False
             self.run_btn.config(text="Run")
+            self._drain_job = None
             return
-        # Handle snapshot/diff logging and check for auto-stop
-        self._handle_post_step()
-
-        # If auto-stop triggered, stop scheduling
-        if not self.running:
-            self.log("Continuous run stopped by condition.")
-            return
-
-        self.update_view()
-        # Schedule next
-        self._run_job = self.after(10, self.run_loop)  # 10ms per cycle (fast)
+        self._drain_job = self.after(50, self._drain_ui_queue)
 
     def toggle_run(self):
         if not self.model:
@@ -276,9 +407,10 @@ class PipelinedGUI(tk.Tk):
         else:
             self.run_btn.config(text="Run")
             self.log("Stopped")
-            if self._run_job:
-                self.after_cancel(self._run_job)
-                self._run_job = None
+            self._sim_stop.set()
+            if self._drain_job:
+                self.after_cancel(self._drain_job)
+                self._drain_job = None
 
     def run_n_cycles(self):
         """Run N cycles (non-blocking, cancellable via the 'Run N' button)."""
@@ -293,16 +425,24 @@ class PipelinedGUI(tk.Tk):
             return
         self.log(f"Run N: executing {n} cycles...")
         self._run_n_remaining = n
+        self._suppress_diffs = not self._verbose_diff.get()
+        self._diff_mask = 0
+        self._diff_window = 0
         # Disable conflicting controls
         self.step_btn.config(state=tk.DISABLED)
         self.run_btn.config(state=tk.DISABLED)
         # Change button into a stop control
         self.run_n_btn.config(text="Stop N", command=self.stop_run_n)
-        # Start stepping
-        self.after(1, self._run_n_step)
+        # Start stepping as soon as the event queue drains — no OS timer
+        # quantum between batches
+        self.after_idle(self._run_n_step)
 
     def _run_n_step(self):
-        """Single-step helper for run_n_cycles."""
+        """Batched stepping helper for run_n_cycles.
+
+        Executes up to _batch_size cycles per Tk callback so the event
+        loop is entered once per batch instead of once per cycle.
+        """
         if not self.model:
             self._run_n_remaining = 0
         if self._run_n_remaining <= 0:
@@ -312,7 +452,14 @@ class PipelinedGUI(tk.Tk):
             self.run_btn.config(state=tk.NORMAL)
             return
         try:
-            self.model.sim.step()
+            with self._sim_lock:
+                for _ in range(min(self._batch_size, self._run_n_remaining)):
+                    self.model.sim.step()
+                    self._run_n_remaining -= 1
+                    # After a successful step, handle diffs & auto-stop
+                    self._handle_post_step()
+                    if self._run_n_remaining <= 0:
+                        break
         except Exception as e:
             self.log(f"Error during Run N: {e}")
             messagebox.showerror("Simulation Error", str(e))
@@ -321,19 +468,16 @@ class PipelinedGUI(tk.Tk):
             self.step_btn.config(state=tk.NORMAL)
             self.run_btn.config(state=tk.NORMAL)
             return
-        # After a successful step, handle diffs & auto-stop
-        self._handle_post_step()
         # If auto-stop cancelled run_n, ensure we clean up
         if self._run_n_remaining <= 0:
             self.run_n_btn.config(text="Run N", command=self.run_n_cycles)
             self.step_btn.config(state=tk.NORMAL)
             self.run_btn.config(state=tk.NORMAL)
             return
-        self._run_n_remaining -= 1
-        # Update UI
+        # Update UI once per batch
         self.update_view()
-        # Schedule next step
-        self.after(1, self._run_n_step)
+        # Yield to pending events, then continue with the next batch
+        self.after_idle(self._run_n_step)
 
     def stop_run_n(self):
         self.log("Run N: cancelled by user")
@@ -350,11 +494,19 @@ class PipelinedGUI(tk.Tk):
         # Reset cycles counter to 0 in simulator
         # Note: PipelinedModel keeps memory intact; registers reset
         self.log("Simulator reset (registers cleared).")
+        # Force a full redraw after reset and forget memoized empty state
+        self._last_rendered_snapshot = None
+        self._last_pc_for_empty = None
+        self._cached_empty = False
         self.update_view()
 
     def update_view(self):
         if not self.model:
             return
+        # Nothing changed since the last render: skip all widget writes
+        if (self._prev_snapshot is not None
+                and self._prev_snapshot == self._last_rendered_snapshot):
+            return
         core = self.core
         try:
             # Prefer model API where available
@@ -367,28 +519,32 @@ class PipelinedGUI(tk.Tk):
                 except Exception:
                     pc = 0
 
-            self.pc_label.config(text=f"PC: 0x{pc:08X}")
+            pc_text = f"PC: 0x{pc:08X}"
 
-            # Instruction (attempt to read 4 bytes from instruction memory)
-            try:
-                inst_bytes = self.model.readInstMem(pc, 4)
-                inst_display = inst_bytes[0] if inst_bytes else '0x00000000'
-            except Exception:
-                inst_display = 'N/A'
-            self.ifid_label.config(text=f"IF/ID: inst={inst_display} pc=0x{pc:08X}")
+            # Instruction (attempt to read 4 bytes from instruction memory);
+            # memoized on PC so a stalled pipeline costs no memory read
+            if pc == self._last_pc_inst[0]:
+                inst_display = self._last_pc_inst[1]
+            else:
+                try:
+                    inst_bytes = self.model.readInstMem(pc, 4)
+                    inst_display = inst_bytes[0] if inst_bytes else '0x00000000'
+                except Exception:
+                    inst_display = 'N/A'
+                self._last_pc_inst = (pc, inst_display)
+            ifid_text = f"IF/ID: inst={inst_display} pc=0x{pc:08X}"
 
             # EX/ALU (best effort)
-            alu_text = 'EX: N/A'
+            ex_text = 'EX: N/A'
             try:
                 if hasattr(core, 'exmem_reg'):
                     ex = core.exmem_reg.EXMEM_o.read()
-                    alu_text = f"EX: alu_res=0x{ex.alu_res:08X} take_branch={ex.take_branch}"
+                    ex_text = f"EX: alu_res=0x{ex.alu_res:08X} take_branch={ex.take_branch}"
                 elif hasattr(core, 'EXMEM'):
                     ex = core.EXMEM.read()
-                    alu_text = f"EX: alu_res=0x{ex.alu_res:08X} take_branch={ex.take_branch}"
+                    ex_text = f"EX: alu_res=0x{ex.alu_res:08X} take_branch={ex.take_branch}"
             except Exception:
                 pass
-            self.ex_label.config(text=alu_text)
 
             # MEM
             mem_text = 'MEM: N/A'
@@ -398,10 +554,22 @@ class PipelinedGUI(tk.Tk):
                     mem_text = f"MEM: mem_rdata=0x{m.mem_rdata:08X} wb_sel={m.wb_sel}"
             except Exception:
                 pass
-            self.mem_label.config(text=mem_text)
 
-            # Registers x0-x15 via model API
-            regs = []
+            # Push label text in one pass, skipping unchanged labels
+            last = self._last_labels
+            for key, widget, new in (('pc', self.pc_label, pc_text),
+                                     ('ifid', self.ifid_label, ifid_text),
+                                     ('ex', self.ex_label, ex_text),
+                                     ('mem', self.mem_label, mem_text)):
+                if new != last[key]:
+                    widget.config(text=new)
+                    last[key] = new
+
+            # Registers x0-x15 via model API; only changed lines are
+            # replaced, between a single NORMAL/DISABLED state flip
+            prefixes = self._reg_prefixes
+            cache = self._reg_cache
+            dirty = False
             for i in range(16):
                 try:
                     val = self.model.readReg(i)
@@ -410,133 +578,239 @@ class PipelinedGUI(tk.Tk):
                         val = core.regf.read(i)
                     except Exception:
                         val = 0
-                regs.append(f"x{i:02} = 0x{val:08X}")
-            self.reg_text.config(state=tk.NORMAL)
-            self.reg_text.delete('1.0', tk.END)
-            self.reg_text.insert(tk.END, "\n".join(regs))
-            self.reg_text.config(state=tk.DISABLED)
+                line = prefixes[i] + format(val, '08X')
+                if line != cache[i]:
+                    if not dirty:
+                        self.reg_text.config(state=tk.NORMAL)
+                        dirty = True
+                    self.reg_text.replace(f'{i + 1}.0', f'{i + 1}.end', line)
+                    cache[i] = line
+            if dirty:
+                self.reg_text.config(state=tk.DISABLED)
 
             self.log(f"Cycle: {self.model.get_cycles()}  PC=0x{pc:08X}")
+            self._last_rendered_snapshot = self._prev_snapshot
         except Exception as e:
             self.log(f"Error updating view: {e}")
 
+    def _bind_accessors(self):
+        """Probe the loaded model once and cache bound read methods.
+
+        The snapshot/view code runs every cycle; doing hasattr/getattr
+        probes there costs attribute walks per cycle. Each accessor is
+        a bound method, or None when the model doesn't provide it.
+        """
+        model = self.model
+        core = self.core
+        self._read_pc = getattr(model, 'readPC', None)
+        # Resolve the register accessor once: prefer the model API, fall
+        # back to the core regfile, and verify it actually works on x0 so
+        # the per-cycle snapshot loop needs no per-register try/except
+        read_reg = getattr(model, 'readReg', None)
+        if read_reg is None and hasattr(core, 'regf'):
+            read_reg = core.regf.read
+        if read_reg is not None:
+            try:
+                read_reg(0)
+            except Exception:
+                read_reg = None
+        self._read_reg = read_reg
+        self._read_ifid = None
+        self._read_idex = None
+        self._read_exmem = None
+        self._read_memwb = None
+        if hasattr(core, 'ifid_reg'):
+            self._read_ifid = core.ifid_reg.IFID_o.read
+        if hasattr(core, 'idex_reg'):
+            self._read_idex = core.idex_reg.IDEX_o.read
+        if hasattr(core, 'exmem_reg'):
+            self._read_exmem = core.exmem_reg.EXMEM_o.read
+        if hasattr(core, 'memwb_reg'):
+            self._read_memwb = core.memwb_reg.MEMWB_o.read
+
+    # Snapshot tuple layout (see _snapshot_state)
+    _SNAP_PC = 0
+    _SNAP_REGS = 1  # registers x0-x15 occupy indices 1..16
+    _SNAP_IFID_INST = 17
+    _SNAP_IFID_PC = 18
+    _SNAP_EX_ALU = 19
+    _SNAP_EX_TB = 20
+    _SNAP_MEM_RDATA = 21
+    _SNAP_IDEX_OPC = 22
+    _SNAP_IDEX_RD = 23
+    _SNAP_EXMEM_RD = 24
+    _SNAP_MEMWB_RD = 25
+
     def _snapshot_state(self):
-        """Return a compact snapshot of observable state."""
-        core = getattr(self, 'core', None)
-        snap = {}
+        """Return a compact snapshot of observable state.
+
+        The snapshot is a flat tuple of values (see the _SNAP_* index
+        constants), so the common no-change case is a single C-level
+        tuple comparison instead of nested dict walks.
+        """
         # PC
-        try:
-            snap['pc'] = self.model.readPC()
-        except Exception:
+        pc = None
+        if self._read_pc is not None:
             try:
-                snap['pc'] = core.pc_reg.cur.read()
+                pc = self._read_pc()
             except Exception:
-                snap['pc'] = None
+                pass
 
-        # Registers x0-x15
-        regs = {}
-        for i in range(16):
+        # Registers x0-x15 — the accessor was validated at bind time, so
+        # this is a plain loop; transient failures fall back to no-reads
+        regs = (None,) * 16
+        if self._read_reg is not None:
             try:
-                regs[i] = self.model.readReg(i)
+                regs = tuple(map(self._read_reg, range(16)))
             except Exception:
-                try:
-                    regs[i] = core.regf.read(i)
-                except Exception:
-                    regs[i] = None
-        snap['regs'] = regs
+                pass
 
         # IF/ID instruction
-        try:
-            if hasattr(core, 'ifid_reg'):
-                ifid = core.ifid_reg.IFID_o.read()
-                snap['ifid_inst'] = getattr(ifid, 'inst', None)
-                snap['ifid_pc'] = getattr(ifid, 'pc', None)
-            else:
-                snap['ifid_inst'] = None
-                snap['ifid_pc'] = None
-        except Exception:
-            snap['ifid_inst'] = None
-            snap['ifid_pc'] = None
+        ifid_inst = ifid_pc = None
+        if self._read_ifid is not None:
+            try:
+                ifid = self._read_ifid()
+                ifid_inst = ifid.inst
+                ifid_pc = ifid.pc
+            except Exception:
+                pass
+
+        # ID/EX
+        idex_opcode = idex_rd = None
+        if self._read_idex is not None:
+            try:
+                idex = self._read_idex()
+                idex_opcode = idex.opcode
+                idex_rd = idex.rd
+            except Exception:
+                pass
 
         # EX/MEM and MEM/WB
-        try:
-            if hasattr(core, 'exmem_reg'):
-                ex = core.exmem_reg.EXMEM_o.read()
-                snap['ex_alu'] = getattr(ex, 'alu_res', None)
-                snap['ex_take_branch'] = getattr(ex, 'take_branch', None)
-            else:
-                snap['ex_alu'] = None
-                snap['ex_take_branch'] = None
-        except Exception:
-            snap['ex_alu'] = None
-            snap['ex_take_branch'] = None
+        ex_alu = ex_take_branch = exmem_rd = None
+        if self._read_exmem is not None:
+            try:
+                ex = self._read_exmem()
+                ex_alu = ex.alu_res
+                ex_take_branch = ex.take_branch
+                exmem_rd = ex.rd
+            except Exception:
+                pass
 
-        try:
-            if hasattr(core, 'memwb_reg'):
-                memwb = core.memwb_reg.MEMWB_o.read()
-                snap['mem_rdata'] = getattr(memwb, 'mem_rdata', None)
-            else:
-                snap['mem_rdata'] = None
-        except Exception:
-            snap['mem_rdata'] = None
+        mem_rdata = memwb_rd = None
+        if self._read_memwb is not None:
+            try:
+                memwb = self._read_memwb()
+                mem_rdata = memwb.mem_rdata
+                memwb_rd = memwb.rd
+            except Exception:
+                pass
 
-        return snap
+        return (pc,) + regs + (ifid_inst, ifid_pc, ex_alu, ex_take_branch,
+                               mem_rdata, idex_opcode, idex_rd, exmem_rd,
+                               memwb_rd)
 
     def _format_diff(self, prev, cur):
         """Return list of human-readable diff lines between prev and cur snapshots."""
+        if prev == cur:
+            # Fast path: nothing changed this cycle
+            return []
+
         lines = []
         if prev is None:
-            lines.append(f"PC: {cur.get('pc'):#010x}" if cur.get('pc') is not None else "PC: N/A")
+            pc = cur[self._SNAP_PC]
+            lines.append(f"PC: {pc:#010x}" if pc is not None else "PC: N/A")
             # show a summary of registers
-            regs = cur.get('regs', {})
-            changed = [f"x{i}=0x{v:08X}" for i, v in regs.items() if v is not None]
+            changed = [f"x{i}=0x{v:08X}"
+                       for i, v in enumerate(cur[1:17]) if v is not None]
             if changed:
                 lines.append("Regs: " + ' '.join(changed))
             return lines
 
         # PC change
-        pprev = prev.get('pc')
-        pcur = cur.get('pc')
+        pprev = prev[self._SNAP_PC]
+        pcur = cur[self._SNAP_PC]
         if pprev != pcur:
             lines.append(f"PC: {pprev:#010x} -> {pcur:#010x}")
 
-        # Registers changes (only show those that changed)
-        regs_prev = prev.get('regs', {})
-        regs_cur = cur.get('regs', {})
-        reg_lines = []
+        # Register changes, folded into one compact line. A single
+        # f-string per changed register keeps allocations minimal on
+        # busy cycles (the no-change case already returned above).
+        parts = []
+        append = parts.append
         for i in range(16):
-            pv = regs_prev.get(i)
-            cv = regs_cur.get(i)
+            pv = prev[1 + i]
+            cv = cur[1 + i]
             if pv != cv:
-                pv_s = f"0x{pv:08X}" if pv is not None else 'N/A'
-                cv_s = f"0x{cv:08X}" if cv is not None else 'N/A'
-                reg_lines.append(f"x{i}: {pv_s} -> {cv_s}")
-        if reg_lines:
-            lines.extend(reg_lines)
+                if pv is None or cv is None:
+                    append(f"x{i}:{pv}->{cv}")
+                else:
+                    append(f"x{i}:{pv:08X}->{cv:08X}")
+        if parts:
+            lines.append("Regs: " + ' '.join(parts))
 
         # IF/ID change
-        if prev.get('ifid_inst') != cur.get('ifid_inst') or prev.get('ifid_pc') != cur.get('ifid_pc'):
-            lines.append(f"IF/ID: inst {prev.get('ifid_inst')} -> {cur.get('ifid_inst')} pc {prev.get('ifid_pc')} -> {cur.get('ifid_pc')}")
+        if (prev[self._SNAP_IFID_INST] != cur[self._SNAP_IFID_INST]
+                or prev[self._SNAP_IFID_PC] != cur[self._SNAP_IFID_PC]):
+            lines.append(f"IF/ID: inst {prev[self._SNAP_IFID_INST]} -> {cur[self._SNAP_IFID_INST]} pc {prev[self._SNAP_IFID_PC]} -> {cur[self._SNAP_IFID_PC]}")
 
         # EX
-        if prev.get('ex_alu') != cur.get('ex_alu'):
-            lines.append(f"EX: alu_res {prev.get('ex_alu')} -> {cur.get('ex_alu')}")
-        if prev.get('ex_take_branch') != cur.get('ex_take_branch'):
-            lines.append(f"EX: take_branch {prev.get('ex_take_branch')} -> {cur.get('ex_take_branch')}")
+        if prev[self._SNAP_EX_ALU] != cur[self._SNAP_EX_ALU]:
+            lines.append(f"EX: alu_res {prev[self._SNAP_EX_ALU]} -> {cur[self._SNAP_EX_ALU]}")
+        if prev[self._SNAP_EX_TB] != cur[self._SNAP_EX_TB]:
+            lines.append(f"EX: take_branch {prev[self._SNAP_EX_TB]} -> {cur[self._SNAP_EX_TB]}")
 
         # MEM
-        if prev.get('mem_rdata') != cur.get('mem_rdata'):
-            lines.append(f"MEM: mem_rdata {prev.get('mem_rdata')} -> {cur.get('mem_rdata')}")
+        if prev[self._SNAP_MEM_RDATA] != cur[self._SNAP_MEM_RDATA]:
+            lines.append(f"MEM: mem_rdata {prev[self._SNAP_MEM_RDATA]} -> {cur[self._SNAP_MEM_RDATA]}")
 
         return lines
 
-    def _handle_post_step(self):
-        """Handle snapshot/diff logging and auto-stop logic after a cycle step."""
-        try:
-            cur = self._snapshot_state()
-            prev = self._prev_snapshot
-            diffs = self._format_diff(prev, cur)
+    def _post_step_lines(self):
+        """Compute diff log lines and auto-stop state after a cycle step.
+
+        Pure model-side logic (no widget access), so it is safe to call
+        from the simulation worker thread as well as the Tk thread.
+
+        Returns:
+            Tuple (lines, stop_reason). `stop_reason` is None, or a
+            message explaining why execution should stop.
+        """
+        cur = self._snapshot_state()
+        prev = self._prev_snapshot
+        lines = []
+        stop_reason = None
 
+        hot = self.running or self._run_n_remaining > 10
+        if hot and self._suppress_diffs:
+            # Non-verbose bulk run: no per-cycle diff lines. Fold register
+            # changes into a bitmask and emit one summary per window.
+            if prev == cur:
+                self._stable_count += 1
+            else:
+                self._stable_count = 0
+                if prev is not None:
+                    mask = self._diff_mask
+                    for i in range(16):
+                        if prev[1 + i] != cur[1 + i]:
+                            mask |= 1 << i
+                    self._diff_mask = mask
+            self._diff_window += 1
+            if self._diff_window >= self._summary_interval:
+                cyc = None
+                try:
+                    cyc = self.model.get_cycles()
+                except Exception:
+                    pass
+                pc = cur[self._SNAP_PC]
+                pc_s = f"0x{pc:08X}" if pc is not None else "N/A"
+                span = (f"{cyc - self._diff_window + 1}-{cyc}"
+                        if cyc is not None else f"(+{self._diff_window})")
+                lines.append(f"Δ cycles {span}: pc={pc_s} "
+                             f"regs_changed=0x{self._diff_mask:04X}")
+                self._diff_mask = 0
+                self._diff_window = 0
+        else:
+            diffs = self._format_diff(prev, cur)
             if diffs:
                 # Log a compact diff with cycle number
                 cyc = None
@@ -545,59 +819,60 @@ class PipelinedGUI(tk.Tk):
                 except Exception:
                     pass
                 prefix = f"Δ Cycle {cyc}: " if cyc is not None else "Δ Cycle: "
-                self.log(prefix + ('\n' + prefix).join(diffs))
+                lines.append(prefix + ('\n' + prefix).join(diffs))
                 self._stable_count = 0
             else:
                 # No observable differences this cycle
                 self._stable_count += 1
 
-            # Check for execution completion (pipeline empty) -- stop immediately
-            try:
-                core = self.core
-                pipeline_empty = True
-                if hasattr(core, 'ifid_reg'):
-                    if core.ifid_reg.IFID_o.read().inst != 0:
-                        pipeline_empty = False
-                if hasattr(core, 'idex_reg'):
-                    idex = core.idex_reg.IDEX_o.read()
-                    if getattr(idex, 'opcode', 0) != 0 or getattr(idex, 'rd', 0) != 0:
-                        pipeline_empty = False
-                if hasattr(core, 'exmem_reg'):
-                    exm = core.exmem_reg.EXMEM_o.read()
-                    if getattr(exm, 'rd', 0) != 0 or getattr(exm, 'alu_res', None) != None:
-                        # treat as non-empty if rd != 0 or alu_res set
-                        if getattr(exm, 'rd', 0) != 0:
-                            pipeline_empty = False
-                if hasattr(core, 'memwb_reg'):
-                    mw = core.memwb_reg.MEMWB_o.read()
-                    if getattr(mw, 'rd', 0) != 0:
-                        pipeline_empty = False
-                if pipeline_empty:
-                    self.log("Pipeline appears empty — execution complete. Stopping.")
-                    if self.running:
-                        self.running = False
-                        self.run_btn.config(text="Run")
-                    if self._run_n_remaining:
-                        self._run_n_remaining = 0
-                        self.run_n_btn.config(text="Run N", command=self.run_n_cycles)
-                    # keep prev snapshot update and return
-                    self._prev_snapshot = cur
-                    return
-            except Exception:
-                pass
+        # Check for execution completion (pipeline empty). Emptiness can
+        # only change when the PC moves, so the result is memoized on PC
+        # and only recomputed (one expression over snapshot fields, no
+        # port reads) when it does; the stop is edge-triggered on the
+        # not-empty -> empty transition. On the single-cycle model the
+        # pipeline fields are None and the check never fires
+        # (stable-count handles that model).
+        cur_pc = cur[self._SNAP_PC]
+        if cur_pc != self._last_pc_for_empty:
+            self._last_pc_for_empty = cur_pc
+            empty = (cur[self._SNAP_IFID_INST] == 0
+                     and cur[self._SNAP_IDEX_OPC] == 0
+                     and cur[self._SNAP_IDEX_RD] == 0
+                     and cur[self._SNAP_EXMEM_RD] == 0
+                     and cur[self._SNAP_MEMWB_RD] == 0)
+            was_empty = self._cached_empty
+            self._cached_empty = empty
+            if empty and not was_empty:
+                self._prev_snapshot = cur
+                return lines, "Pipeline appears empty — execution complete. Stopping."
+
+        if self._stable_count >= self._stable_threshold:
+            stop_reason = (f"No changes observed for {self._stable_count} "
+                           "cycles — stopping execution.")
+
+        # Keep snapshot
+        self._prev_snapshot = cur
+        return lines, stop_reason
+
+    def _stop_all_runs(self):
+        """Stop continuous run and cancel Run N (main thread only)."""
+        if self.running:
+            self.running = False
+            self._sim_stop.set()
+            self.run_btn.config(text="Run")
+        if self._run_n_remaining:
+            self._run_n_remaining = 0
+            self.run_n_btn.config(text="Run N", command=self.run_n_cycles)
 
-            if self._stable_count >= self._stable_threshold:
-                self.log(f"No changes observed for {self._stable_count} cycles — stopping execution.")
-                # stop continuous run and cancel Run N
-                if self.running:
-                    self.running = False
-                    self.run_btn.config(text="Run")
-                if self._run_n_remaining:
-                    self._run_n_remaining = 0
-                    self.run_n_btn.config(text="Run N", command=self.run_n_cycles)
-
-            # Keep snapshot
-            self._prev_snapshot = cur
+    def _handle_post_step(self):
+        """Handle snapshot/diff logging and auto-stop logic after a cycle step."""
+        try:
+            lines, stop_reason = self._post_step_lines()
+            for line in lines:
+                self.log(line)
+            if stop_reason:
+                self.log(stop_reason)
+                self._stop_all_runs()
         except Exception as e:
             self.log(f"Error handling post-step: {e}")
 
@@ -607,28 +882,24 @@ class PipelinedGUI(tk.Tk):
             self.log("No model loaded")
             return
         try:
-            core = self.core
             lines = []
             lines.append("--- Pipeline Trace ---")
             lines.append(f"Cycle: {self.model.get_cycles()}")
 
-            # PC via API if possible
-            try:
-                pc = self.model.readPC()
-            except Exception:
+            # All fields come from the accessors bound at load time; the
+            # pipeline-register ones are None on the single-cycle model,
+            # which simply omits those lines
+            pc = 0
+            if self._read_pc is not None:
                 try:
-                    pc = core.pc_reg.cur.read()
+                    pc = self._read_pc()
                 except Exception:
                     pc = 0
             lines.append(f"PC      : 0x{pc:08X}")
 
-            # IF/ID / instruction
             try:
-                if hasattr(core, 'ifid_reg'):
-                    ifid = core.ifid_reg.IFID_o.read()
-                    lines.append(f"IF/ID   : inst=0x{ifid.inst:08X} pc=0x{ifid.pc:08X}")
-                elif hasattr(core, 'IFID'):
-                    ifid = core.IFID.read()
+                if self._read_ifid is not None:
+                    ifid = self._read_ifid()
                     lines.append(f"IF/ID   : inst=0x{ifid.inst:08X} pc=0x{ifid.pc:08X}")
                 else:
                     inst = self.model.readInstMem(pc, 4)[0]
@@ -636,40 +907,33 @@ class PipelinedGUI(tk.Tk):
             except Exception:
                 lines.append("IF/ID   : N/A")
 
-            # ID/EX (best-effort)
             try:
-                if hasattr(core, 'idex_reg'):
-                    idex = core.idex_reg.IDEX_o.read()
+                if self._read_idex is not None:
+                    idex = self._read_idex()
                     lines.append(f"ID/EX   : rd={idex.rd} we={idex.we} opcode=0x{idex.opcode:02X} imm=0x{idex.imm:08X}")
             except Exception:
                 pass
 
-            # EX/MEM
             try:
-                if hasattr(core, 'exmem_reg'):
-                    exmem = core.exmem_reg.EXMEM_o.read()
+                if self._read_exmem is not None:
+                    exmem = self._read_exmem()
                     lines.append(f"EX/MEM  : rd={exmem.rd} we={exmem.we} alu_res=0x{exmem.alu_res:08X} take_branch={exmem.take_branch}")
             except Exception:
                 pass
 
-            # MEM/WB
             try:
-                if hasattr(core, 'memwb_reg'):
-                    memwb = core.memwb_reg.MEMWB_o.read()
+                if self._read_memwb is not None:
+                    memwb = self._read_memwb()
                     lines.append(f"MEM/WB  : rd={memwb.rd} we={memwb.we} alu_res=0x{memwb.alu_res:08X} mem_rdata=0x{memwb.mem_rdata:08X}")
             except Exception:
                 pass
 
             # Registers (small subset)
-            regs = []
-            for i in range(8):
-                try:
-                    regs.append(f"x{i}={self.model.readReg(i):08X}")
-                except Exception:
-                    try:
-                        regs.append(f"x{i}={core.regf.read(i):08X}")
-                    except Exception:
-                        regs.append(f"x{i}=00000000")
+            read_reg = self._read_reg
+            try:
+                regs = [f"x{i}={read_reg(i):08X}" for i in range(8)]
+            except Exception:
+                regs = [f"x{i}=00000000" for i in range(8)]
             lines.append("Regs   : " + ' '.join(regs))
 
             self.log('\n'.join(lines))
@@ -677,18 +941,36 @@ class PipelinedGUI(tk.Tk):
             self.log(f"Error dumping trace: {e}")
 
     def load_run_log(self):
-        """Load the run.log contents (if present) into GUI log area."""
+        """Load the tail of run.log (if present) into the GUI log area.
+
+        Only the last ~MAX_LOG_LINES worth of bytes is read (the log
+        pane trims to that anyway), and it is streamed into the widget
+        in 64 KB chunks so a multi-MB run.log never blocks the UI or
+        gets duplicated into one giant Python string.
+        """
         try:
             runlog = os.path.join(self.proj_root, 'run.log')
             if not os.path.exists(runlog):
                 self.log("No run.log file found in project dir.")
                 return
-            with open(runlog, 'r') as f:
-                data = f.read()
-            self.log_text.config(state=tk.NORMAL)
-            self.log_text.delete('1.0', tk.END)
-            self.log_text.insert(tk.END, data)
-            self.log_text.config(state=tk.DISABLED)
+            max_bytes = MAX_LOG_LINES * 120  # generous bytes-per-line estimate
+            with open(runlog, 'rb') as f:
+                f.seek(0, os.SEEK_END)
+                size = f.tell()
+                truncated = size > max_bytes
+                if truncated:
+                    f.seek(size - max_bytes)
+                    f.readline()  # drop the partial first line
+                else:
+                    f.seek(0)
+                self.log_text.config(state=tk.NORMAL)
+                self.log_text.delete('1.0', tk.END)
+                if truncated:
+                    self.log_text.insert(tk.END, "[... older run.log lines omitted ...]\n")
+                while chunk := f.read(65536):
+                    self.log_text.insert(tk.END, chunk.decode('utf-8', errors='replace'))
+                    self.log_text.update_idletasks()
+                self.log_text.config(state=tk.DISABLED)
             self.log("Loaded run.log into GUI")
         except Exception as e:
             self.log(f"Error loading run.log: {e}")
@@ -696,6 +978,7 @@ class PipelinedGUI(tk.Tk):
     def clear_logs(self):
         """Clear the GUI log pane and reset snapshot/auto-stop state."""
         try:
+            self._log_buf.clear()
             self.log_text.config(state=tk.NORMAL)
             self.log_text.delete('1.0', tk.END)
             self.log_text.config(state=tk.DISABLED)
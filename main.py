@@ -1,5 +1,6 @@
 import time
 import os
+import shlex
 import subprocess
 from pyv.models.model import Model
 from pyv.models.singlecycle import SingleCycleModel
@@ -30,7 +31,7 @@ def execute_bin(
 
     # Load binary into memory
     print("* Loading binary into memory...")
-    file_size = os.path.getsize(path_to_bin)
+    file_size = os.stat(path_to_bin).st_size
     core.load_binary(path_to_bin)
     print(f"  Loaded {file_size} bytes")
 
@@ -44,7 +45,15 @@ def execute_bin(
     print()
 
     start = time.perf_counter()
-    core.run(num_cycles)
+    # Drive the simulation in fixed-size blocks: registers are reset once,
+    # then the cycle budget is only checked at block boundaries so the
+    # inner loop stays free of per-cycle bookkeeping
+    core.sim.reset()
+    remaining = num_cycles
+    while remaining > 0:
+        block = 256 if remaining > 256 else remaining
+        core.run_block(block)
+        remaining -= block
     end = time.perf_counter()
 
     print(f"\nSimulation complete.")
@@ -86,18 +95,18 @@ def compile_program(program_name: str) -> str:
     """
     program_dir = os.path.join('programs', program_name)
 
-    # Check if program directory exists
-    if not os.path.exists(program_dir):
+    # One scandir pass covers the directory-exists check and the
+    # source-file lookup (.S preferred over .c)
+    try:
+        with os.scandir(program_dir) as it:
+            entries = {e.name for e in it}
+    except OSError:
         raise FileNotFoundError(f"Program directory not found: {program_dir}")
 
-    # Look for source file (.S or .c)
-    asm_file = os.path.join(program_dir, f"{program_name}.S")
-    c_file = os.path.join(program_dir, f"{program_name}.c")
-
-    if os.path.exists(asm_file):
-        source_file = asm_file
-    elif os.path.exists(c_file):
-        source_file = c_file
+    if f"{program_name}.S" in entries:
+        source_file = os.path.join(program_dir, f"{program_name}.S")
+    elif f"{program_name}.c" in entries:
+        source_file = os.path.join(program_dir, f"{program_name}.c")
     else:
         raise FileNotFoundError(f"No .S or .c file found for program: {program_name}")
 
@@ -105,6 +114,17 @@ def compile_program(program_name: str) -> str:
     out_file = os.path.join(program_dir, f"{program_name}.out")
     bin_file = os.path.join(program_dir, f"{program_name}.bin")
 
+    # Skip recompilation when the binary is already newer than its inputs
+    crt_file = os.path.join('programs', 'common', 'crt.S')
+    try:
+        bin_mtime = os.path.getmtime(bin_file)
+        if (bin_mtime >= os.path.getmtime(source_file)
+                and bin_mtime >= os.path.getmtime(crt_file)):
+            print(f"* {os.path.basename(bin_file)} is up to date, skipping compilation")
+            return bin_file
+    except OSError:
+        pass
+
     print(f"* Compiling {os.path.basename(source_file)}...")
 
     # Get toolchain path
@@ -128,35 +148,53 @@ def compile_program(program_name: str) -> str:
         print(f"  Using system toolchain")
 
     try:
-        # Compile source to executable
+        # Compile source to executable, then convert to binary.
         # Explicitly link libgcc to provide software helpers like __divsi3
         gcc_cmd = [gcc_path] + gcc_opts + [source_file, "-o", out_file, "-lgcc"]
-        subprocess.run(gcc_cmd, check=True, capture_output=True)
-
-        # Convert to binary
         objcopy_cmd = [objcopy_path, "-O", "binary", out_file, bin_file]
-        subprocess.run(objcopy_cmd, check=True, capture_output=True)
+
+        if os.name == 'nt':
+            # cmd.exe quoting is unreliable; keep two invocations there
+            subprocess.run(gcc_cmd, check=True,
+                           stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+            subprocess.run(objcopy_cmd, check=True,
+                           stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        else:
+            # One shell launch for both steps halves the fork/exec count
+            shell_cmd = (" ".join(shlex.quote(a) for a in gcc_cmd)
+                         + " && "
+                         + " ".join(shlex.quote(a) for a in objcopy_cmd))
+            subprocess.run(shell_cmd, shell=True, check=True,
+                           stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
 
         print(f"* Compilation successful: {bin_file}")
         return bin_file
 
     except subprocess.CalledProcessError as e:
+        # The shell reports a missing gcc/objcopy as exit code 127
+        if e.returncode == 127:
+            _print_toolchain_missing()
+            raise
         print(f"Error during compilation: {e}")
         if e.stderr:
             print(e.stderr.decode())
         raise
     except FileNotFoundError:
-        print(f"\n{'='*60}")
-        print(f"Error: RISC-V toolchain not found!")
-        print(f"{'='*60}")
-        print(f"\nPlease run the setup script to install the toolchain:")
-        print(f"  python setup_toolchain.py")
-        print(f"\nOr install it manually from:")
-        print(f"  https://github.com/xpack-dev-tools/riscv-none-elf-gcc-xpack/releases")
-        print(f"{'='*60}\n")
+        _print_toolchain_missing()
         raise
 
 
+def _print_toolchain_missing():
+    print(f"\n{'='*60}")
+    print(f"Error: RISC-V toolchain not found!")
+    print(f"{'='*60}")
+    print(f"\nPlease run the setup script to install the toolchain:")
+    print(f"  python setup_toolchain.py")
+    print(f"\nOr install it manually from:")
+    print(f"  https://github.com/xpack-dev-tools/riscv-none-elf-gcc-xpack/releases")
+    print(f"{'='*60}\n")
+
+
 def main():
     print("=" * 60)
     print("RISC-V Simulator")
@@ -202,8 +240,10 @@ def main():
     # Ask for program name
     print("\nAvailable programs in /programs folder:")
     programs_dir = 'programs'
-    available_programs = [d for d in os.listdir(programs_dir)
-                         if os.path.isdir(os.path.join(programs_dir, d)) and d != 'common']
+    # Single scandir pass; DirEntry caches is_dir() from the directory read
+    with os.scandir(programs_dir) as it:
+        available_programs = [e.name for e in it
+                              if e.is_dir() and e.name != 'common']
 
     for i, prog in enumerate(available_programs, 1):
         print(f"  {i}. {prog}")
@@ -232,8 +272,7 @@ def main():
         print("=" * 60)
         print("Final Register Values")
         print("=" * 60)
-        for i in range(1, 11):
-            value = core.readReg(i)
+        for i, value in enumerate(core.core.regf.read_range(1, 11), 1):
             print(f"  x{i:<2} = {value:10} (0x{value:08X})")
         pc_value = core.readPC()
         print(f"  pc  = {pc_value:10} (0x{pc_value:08X})")
@@ -1,251 +1,301 @@
-"""RISC-V instruction disassembler for educational output."""
+"""RISC-V instruction disassembler for educational output.
 
-import pyv.isa as isa
-from pyv.util import get_bit, get_bits
+The hot entry points (`disassemble`, `decode_imm`, `reg_name`) are plain
+module-level functions so callers skip the staticmethod descriptor
+lookup; the `Disassembler` class remains as a thin compatibility shim
+for existing imports.
+"""
 
+import functools
 
-class Disassembler:
-    """Disassembles RISC-V instructions into human-readable format."""
-
-    # Register ABI names for easier reading
-    REG_ABI_NAMES = {
-        0: "zero", 1: "ra", 2: "sp", 3: "gp",
-        4: "tp", 5: "t0", 6: "t1", 7: "t2",
-        8: "s0", 9: "s1", 10: "a0", 11: "a1",
-        12: "a2", 13: "a3", 14: "a4", 15: "a5",
-        16: "a6", 17: "a7", 18: "s2", 19: "s3",
-        20: "s4", 21: "s5", 22: "s6", 23: "s7",
-        24: "s8", 25: "s9", 26: "s10", 27: "s11",
-        28: "t3", 29: "t4", 30: "t5", 31: "t6",
-    }
-
-    @staticmethod
-    def reg_name(reg_num):
-        """Convert register number to ABI name."""
-        return f"x{reg_num}({Disassembler.REG_ABI_NAMES[reg_num]})"
-
-    @staticmethod
-    def decode_imm(opcode, inst):
-        """Decode immediate value from instruction."""
-        sign = get_bit(inst, 31)
-        sign_ext = 0
+import pyv.isa as isa
+
+# Register ABI names for easier reading
+REG_ABI_NAMES = {
+    0: "zero", 1: "ra", 2: "sp", 3: "gp",
+    4: "tp", 5: "t0", 6: "t1", 7: "t2",
+    8: "s0", 9: "s1", 10: "a0", 11: "a1",
+    12: "a2", 13: "a3", 14: "a4", 15: "a5",
+    16: "a6", 17: "a7", 18: "s2", 19: "s3",
+    20: "s4", 21: "s5", 22: "s6", 23: "s7",
+    24: "s8", 25: "s9", 26: "s10", 27: "s11",
+    28: "t3", 29: "t4", 30: "t5", 31: "t6",
+}
+
+# Display strings "x<n>(<abi>)" built once; reg_name is called up to
+# three times per disassembled instruction
+_REG_DISPLAY = tuple(f"x{i}({abi})" for i, abi in REG_ABI_NAMES.items())
+
+
+def reg_name(reg_num):
+    """Convert register number to ABI name."""
+    return _REG_DISPLAY[reg_num]
+
+
+def decode_imm(opcode, inst):
+    """Decode immediate value from instruction.
+
+    Each format is a single shift/mask expression with an explicit
+    sign-extension mask, avoiding the half-dozen get_bit/get_bits
+    calls per instruction the field-by-field assembly needed.
+    """
+    if opcode in isa.INST_I:
+        imm = (inst >> 20) & 0xFFF
+        if imm & 0x800:
+            imm |= 0xFFFFF000
+
+    elif opcode in isa.INST_S:
+        imm = ((inst >> 20) & 0xFE0) | ((inst >> 7) & 0x1F)
+        if imm & 0x800:
+            imm |= 0xFFFFF000
+
+    elif opcode in isa.INST_B:
+        imm = (((inst >> 19) & 0x1000) | ((inst << 4) & 0x800)
+               | ((inst >> 20) & 0x7E0) | ((inst >> 7) & 0x1E))
+        if imm & 0x1000:
+            imm |= 0xFFFFE000
+
+    elif opcode in isa.INST_U:
+        imm = inst & 0xFFFFF000
+
+    elif opcode in isa.INST_J:
+        imm = (((inst >> 11) & 0x100000) | (inst & 0xFF000)
+               | ((inst >> 9) & 0x800) | ((inst >> 20) & 0x7FE))
+        if imm & 0x100000:
+            imm |= 0xFFE00000
+
+    else:
         imm = 0
 
-        if opcode in isa.INST_I:
-            imm = get_bits(inst, 31, 20)
-            if sign:
-                sign_ext = 0xfffff << 12
-
-        elif opcode in isa.INST_S:
-            imm_11_5 = get_bits(inst, 31, 25)
-            imm_4_0 = get_bits(inst, 11, 7)
-            imm = (imm_11_5 << 5) | imm_4_0
-            if sign:
-                sign_ext = 0xfffff << 12
-
-        elif opcode in isa.INST_B:
-            imm_12 = get_bit(inst, 31)
-            imm_10_5 = get_bits(inst, 30, 25)
-            imm_4_1 = get_bits(inst, 11, 8)
-            imm_11 = get_bits(inst, 7, 7)
-            imm = ((imm_12 << 12) | (imm_11 << 11) | (imm_10_5 << 5) | (imm_4_1 << 1))
-            if sign:
-                sign_ext = 0x7ffff << 13
-
-        elif opcode in isa.INST_U:
-            imm = get_bits(inst, 31, 12) << 12
-
-        elif opcode in isa.INST_J:
-            imm_20 = get_bit(inst, 31)
-            imm_10_1 = get_bits(inst, 30, 21)
-            imm_11 = get_bits(inst, 20, 20)
-            imm_19_12 = get_bits(inst, 19, 12)
-            imm = ((imm_20 << 20) | (imm_19_12 << 12) | (imm_11 << 11) | (imm_10_1 << 1))
-            if sign:
-                sign_ext = 0x7ff << 21
-
-        return sign_ext | imm
-
-    @staticmethod
-    def disassemble(inst):
-        """Disassemble a single instruction.
-
-        Args:
-            inst: 32-bit instruction word
-
-        Returns:
-            Tuple of (mnemonic, description) strings
-        """
-        if inst == 0x00000013:
-            return "NOP", "nop (addi x0, x0, 0)"
-
-        if inst == 0x73:
-            return "ECALL", "ecall"
-
-        if inst == 0x30200073:
-            return "MRET", "mret"
-
-        # Check if valid instruction
-        if (inst & 0x3) != 0x3:
-            return "INVALID", f"invalid instruction (0x{inst:08x})"
-
-        opcode = get_bits(inst, 6, 2)
-        funct3 = get_bits(inst, 14, 12)
-        funct7 = get_bits(inst, 31, 25)
-        rd = get_bits(inst, 11, 7)
-        rs1 = get_bits(inst, 19, 15)
-        rs2 = get_bits(inst, 24, 20)
-        imm = Disassembler.decode_imm(opcode, inst)
-
-        # Convert to signed for display
-        def to_signed(val, bits=32):
-            if val & (1 << (bits - 1)):
-                return val - (1 << bits)
-            return val
-
-        imm_signed = to_signed(imm)
+    return imm
+
+
+# Opcode dispatch for disassemble. Each handler receives the pre-decoded
+# fields and returns a (mnemonic, description) tuple, or None when the
+# funct fields don't match a known encoding. A dict lookup per opcode
+# (plus one per funct group) replaces the linear if/elif cascade.
+
+def _fmt_table(mnemonics, operands):
+    """Expand a funct->mnemonic table into (MNEMONIC, template) pairs.
+
+    The operand template is built once per mnemonic at import time, so
+    handlers only run a .format over a prebuilt string instead of
+    assembling a fresh f-string per decode.
+    """
+    return {k: (m.upper(), m + operands) for k, m in mnemonics.items()}
+
+
+# R-type: (funct3, funct7) -> (mnemonic, template)
+_R_TYPE = _fmt_table({
+    (0b000, 0): "add", (0b001, 0): "sll", (0b010, 0): "slt",
+    (0b011, 0): "sltu", (0b100, 0): "xor", (0b101, 0): "srl",
+    (0b110, 0): "or", (0b111, 0): "and",
+    (0b000, 0b0100000): "sub", (0b101, 0b0100000): "sra",
+}, " {rd}, {rs1}, {rs2}")
+
+# I-type arithmetic (shifts handled separately): funct3 -> (mnemonic, template)
+_I_ARITH = _fmt_table({
+    0b000: "addi", 0b010: "slti", 0b011: "sltiu",
+    0b100: "xori", 0b110: "ori", 0b111: "andi",
+}, " {rd}, {rs1}, {imm}")
+
+_SHIFT_TPL = {
+    "SLLI": "slli {rd}, {rs1}, {imm}",
+    "SRLI": "srli {rd}, {rs1}, {imm}",
+    "SRAI": "srai {rd}, {rs1}, {imm}",
+}
+
+_LOADS = _fmt_table({0: "lb", 1: "lh", 2: "lw", 4: "lbu", 5: "lhu"},
+                    " {rd}, {imm}({rs1})")
+_STORES = _fmt_table({0: "sb", 1: "sh", 2: "sw"}, " {rs2}, {imm}({rs1})")
+_BRANCHES = _fmt_table({0: "beq", 1: "bne", 4: "blt", 5: "bge",
+                        6: "bltu", 7: "bgeu"}, " {rs1}, {rs2}, {imm}")
+
+# CSR: funct3 -> (mnemonic, template, operand is a register rather than
+# an immediate zimm field)
+_CSR_OPS = {
+    isa.CSR_F3["CSRRW"]: ("CSRRW", "csrrw {rd}, 0x{csr:03x}, {src}", True),
+    isa.CSR_F3["CSRRS"]: ("CSRRS", "csrrs {rd}, 0x{csr:03x}, {src}", True),
+    isa.CSR_F3["CSRRC"]: ("CSRRC", "csrrc {rd}, 0x{csr:03x}, {src}", True),
+    isa.CSR_F3["CSRRWI"]: ("CSRRWI", "csrrwi {rd}, 0x{csr:03x}, {src}", False),
+    isa.CSR_F3["CSRRSI"]: ("CSRRSI", "csrrsi {rd}, 0x{csr:03x}, {src}", False),
+    isa.CSR_F3["CSRRCI"]: ("CSRRCI", "csrrci {rd}, 0x{csr:03x}, {src}", False),
+}
+
+
+def _decode_op(inst, rd, rs1, rs2, funct3, funct7, imm_signed):
+    entry = _R_TYPE.get((funct3, funct7))
+    if entry is None:
+        return None
+    mnem, tpl = entry
+    return mnem, tpl.format(rd=reg_name(rd), rs1=reg_name(rs1),
+                            rs2=reg_name(rs2))
+
+
+def _decode_opimm(inst, rd, rs1, rs2, funct3, funct7, imm_signed):
+    # Shifts encode the shift amount in the rs2 field
+    if funct3 == 0b001:
+        mnem = "SLLI"
+    elif funct3 == 0b101:
+        if funct7 == 0:
+            mnem = "SRLI"
+        elif funct7 == 0b0100000:
+            mnem = "SRAI"
+        else:
+            return None
+    else:
+        entry = _I_ARITH.get(funct3)
+        if entry is None:
+            return None
+        mnem, tpl = entry
+        return mnem, tpl.format(rd=reg_name(rd), rs1=reg_name(rs1),
+                                imm=imm_signed)
+    return mnem, _SHIFT_TPL[mnem].format(rd=reg_name(rd), rs1=reg_name(rs1),
+                                         imm=rs2)
+
+
+def _decode_load(inst, rd, rs1, rs2, funct3, funct7, imm_signed):
+    entry = _LOADS.get(funct3)
+    if entry is None:
+        return None
+    mnem, tpl = entry
+    return mnem, tpl.format(rd=reg_name(rd), rs1=reg_name(rs1),
+                            imm=imm_signed)
+
+
+def _decode_store(inst, rd, rs1, rs2, funct3, funct7, imm_signed):
+    entry = _STORES.get(funct3)
+    if entry is None:
+        return None
+    mnem, tpl = entry
+    return mnem, tpl.format(rs1=reg_name(rs1), rs2=reg_name(rs2),
+                            imm=imm_signed)
+
+
+def _decode_branch(inst, rd, rs1, rs2, funct3, funct7, imm_signed):
+    entry = _BRANCHES.get(funct3)
+    if entry is None:
+        return None
+    mnem, tpl = entry
+    return mnem, tpl.format(rs1=reg_name(rs1), rs2=reg_name(rs2),
+                            imm=imm_signed)
+
+
+_JAL_TPL = "jal {rd}, {imm}"
+_JALR_TPL = "jalr {rd}, {rs1}, {imm}"
+_LUI_TPL = "lui {rd}, {imm}"
+_AUIPC_TPL = "auipc {rd}, {imm}"
+
+
+def _decode_jal(inst, rd, rs1, rs2, funct3, funct7, imm_signed):
+    return "JAL", _JAL_TPL.format(rd=reg_name(rd), imm=imm_signed)
+
+
+def _decode_jalr(inst, rd, rs1, rs2, funct3, funct7, imm_signed):
+    return "JALR", _JALR_TPL.format(rd=reg_name(rd), rs1=reg_name(rs1),
+                                    imm=imm_signed)
+
+
+def _decode_lui(inst, rd, rs1, rs2, funct3, funct7, imm_signed):
+    upimm = (imm_signed >> 12) & 0xFFFFF
+    return "LUI", _LUI_TPL.format(rd=reg_name(rd), imm=upimm)
+
+
+def _decode_auipc(inst, rd, rs1, rs2, funct3, funct7, imm_signed):
+    upimm = (imm_signed >> 12) & 0xFFFFF
+    return "AUIPC", _AUIPC_TPL.format(rd=reg_name(rd), imm=upimm)
+
+
+def _decode_system(inst, rd, rs1, rs2, funct3, funct7, imm_signed):
+    op = _CSR_OPS.get(funct3)
+    if op is None:
+        return None
+    mnem, tpl, reg_operand = op
+    csr = (inst >> 20) & 0xFFF
+    src = reg_name(rs1) if reg_operand else rs1
+    return mnem, tpl.format(rd=reg_name(rd), csr=csr, src=src)
+
+
+_DISPATCH = {
+    isa.OPCODES["OP"]: _decode_op,
+    isa.OPCODES["OP-IMM"]: _decode_opimm,
+    isa.OPCODES["LOAD"]: _decode_load,
+    isa.OPCODES["STORE"]: _decode_store,
+    isa.OPCODES["BRANCH"]: _decode_branch,
+    isa.OPCODES["JAL"]: _decode_jal,
+    isa.OPCODES["JALR"]: _decode_jalr,
+    isa.OPCODES["LUI"]: _decode_lui,
+    isa.OPCODES["AUIPC"]: _decode_auipc,
+    isa.OPCODES["SYSTEM"]: _decode_system,
+}
+
+
+@functools.lru_cache(maxsize=4096)
+def disassemble(inst):
+    """Disassemble a single instruction.
+
+    This is the one cached entry point for decoding: the immediate
+    (via decode_imm) and the formatted description are computed at
+    most once per unique instruction word, so a word flowing
+    through all five pipeline stages costs four cache hits. The
+    cache is bounded in case a run streams through more code than
+    any bundled program contains.
+
+    Args:
+        inst: 32-bit instruction word
+
+    Returns:
+        Tuple of (mnemonic, description) strings
+    """
+    if inst == 0x00000013:
+        return "NOP", "nop (addi x0, x0, 0)"
 
-        try:
-            # R-type instructions
-            if opcode == isa.OPCODES["OP"]:
-                rd_name = Disassembler.reg_name(rd)
-                rs1_name = Disassembler.reg_name(rs1)
-                rs2_name = Disassembler.reg_name(rs2)
-
-                if funct7 == 0:
-                    if funct3 == 0b000:
-                        return "ADD", f"add {rd_name}, {rs1_name}, {rs2_name}"
-                    elif funct3 == 0b001:
-                        return "SLL", f"sll {rd_name}, {rs1_name}, {rs2_name}"
-                    elif funct3 == 0b010:
-                        return "SLT", f"slt {rd_name}, {rs1_name}, {rs2_name}"
-                    elif funct3 == 0b011:
-                        return "SLTU", f"sltu {rd_name}, {rs1_name}, {rs2_name}"
-                    elif funct3 == 0b100:
-                        return "XOR", f"xor {rd_name}, {rs1_name}, {rs2_name}"
-                    elif funct3 == 0b101:
-                        return "SRL", f"srl {rd_name}, {rs1_name}, {rs2_name}"
-                    elif funct3 == 0b110:
-                        return "OR", f"or {rd_name}, {rs1_name}, {rs2_name}"
-                    elif funct3 == 0b111:
-                        return "AND", f"and {rd_name}, {rs1_name}, {rs2_name}"
-                elif funct7 == 0b0100000:
-                    if funct3 == 0b000:
-                        return "SUB", f"sub {rd_name}, {rs1_name}, {rs2_name}"
-                    elif funct3 == 0b101:
-                        return "SRA", f"sra {rd_name}, {rs1_name}, {rs2_name}"
-
-            # I-type instructions
-            elif opcode == isa.OPCODES["OP-IMM"]:
-                rd_name = Disassembler.reg_name(rd)
-                rs1_name = Disassembler.reg_name(rs1)
-                shamt = get_bits(inst, 24, 20)
-
-                if funct3 == 0b000:
-                    return "ADDI", f"addi {rd_name}, {rs1_name}, {imm_signed}"
-                elif funct3 == 0b010:
-                    return "SLTI", f"slti {rd_name}, {rs1_name}, {imm_signed}"
-                elif funct3 == 0b011:
-                    return "SLTIU", f"sltiu {rd_name}, {rs1_name}, {imm_signed}"
-                elif funct3 == 0b100:
-                    return "XORI", f"xori {rd_name}, {rs1_name}, {imm_signed}"
-                elif funct3 == 0b110:
-                    return "ORI", f"ori {rd_name}, {rs1_name}, {imm_signed}"
-                elif funct3 == 0b111:
-                    return "ANDI", f"andi {rd_name}, {rs1_name}, {imm_signed}"
-                elif funct3 == 0b001:
-                    return "SLLI", f"slli {rd_name}, {rs1_name}, {shamt}"
-                elif funct3 == 0b101:
-                    if funct7 == 0:
-                        return "SRLI", f"srli {rd_name}, {rs1_name}, {shamt}"
-                    elif funct7 == 0b0100000:
-                        return "SRAI", f"srai {rd_name}, {rs1_name}, {shamt}"
-
-            # Load instructions
-            elif opcode == isa.OPCODES["LOAD"]:
-                rd_name = Disassembler.reg_name(rd)
-                rs1_name = Disassembler.reg_name(rs1)
-
-                if funct3 == 0:
-                    return "LB", f"lb {rd_name}, {imm_signed}({rs1_name})"
-                elif funct3 == 1:
-                    return "LH", f"lh {rd_name}, {imm_signed}({rs1_name})"
-                elif funct3 == 2:
-                    return "LW", f"lw {rd_name}, {imm_signed}({rs1_name})"
-                elif funct3 == 4:
-                    return "LBU", f"lbu {rd_name}, {imm_signed}({rs1_name})"
-                elif funct3 == 5:
-                    return "LHU", f"lhu {rd_name}, {imm_signed}({rs1_name})"
-
-            # Store instructions
-            elif opcode == isa.OPCODES["STORE"]:
-                rs1_name = Disassembler.reg_name(rs1)
-                rs2_name = Disassembler.reg_name(rs2)
-
-                if funct3 == 0:
-                    return "SB", f"sb {rs2_name}, {imm_signed}({rs1_name})"
-                elif funct3 == 1:
-                    return "SH", f"sh {rs2_name}, {imm_signed}({rs1_name})"
-                elif funct3 == 2:
-                    return "SW", f"sw {rs2_name}, {imm_signed}({rs1_name})"
-
-            # Branch instructions
-            elif opcode == isa.OPCODES["BRANCH"]:
-                rs1_name = Disassembler.reg_name(rs1)
-                rs2_name = Disassembler.reg_name(rs2)
-
-                if funct3 == 0:
-                    return "BEQ", f"beq {rs1_name}, {rs2_name}, {imm_signed}"
-                elif funct3 == 1:
-                    return "BNE", f"bne {rs1_name}, {rs2_name}, {imm_signed}"
-                elif funct3 == 4:
-                    return "BLT", f"blt {rs1_name}, {rs2_name}, {imm_signed}"
-                elif funct3 == 5:
-                    return "BGE", f"bge {rs1_name}, {rs2_name}, {imm_signed}"
-                elif funct3 == 6:
-                    return "BLTU", f"bltu {rs1_name}, {rs2_name}, {imm_signed}"
-                elif funct3 == 7:
-                    return "BGEU", f"bgeu {rs1_name}, {rs2_name}, {imm_signed}"
-
-            # Jump instructions
-            elif opcode == isa.OPCODES["JAL"]:
-                rd_name = Disassembler.reg_name(rd)
-                return "JAL", f"jal {rd_name}, {imm_signed}"
-
-            elif opcode == isa.OPCODES["JALR"]:
-                rd_name = Disassembler.reg_name(rd)
-                rs1_name = Disassembler.reg_name(rs1)
-                return "JALR", f"jalr {rd_name}, {rs1_name}, {imm_signed}"
-
-            # U-type instructions
-            elif opcode == isa.OPCODES["LUI"]:
-                rd_name = Disassembler.reg_name(rd)
-                return "LUI", f"lui {rd_name}, {imm >> 12}"
-
-            elif opcode == isa.OPCODES["AUIPC"]:
-                rd_name = Disassembler.reg_name(rd)
-                return "AUIPC", f"auipc {rd_name}, {imm >> 12}"
-
-            # CSR instructions
-            elif opcode == isa.OPCODES["SYSTEM"]:
-                rd_name = Disassembler.reg_name(rd)
-                rs1_name = Disassembler.reg_name(rs1)
-                csr = get_bits(inst, 31, 20)
-
-                if funct3 == isa.CSR_F3["CSRRW"]:
-                    return "CSRRW", f"csrrw {rd_name}, 0x{csr:03x}, {rs1_name}"
-                elif funct3 == isa.CSR_F3["CSRRS"]:
-                    return "CSRRS", f"csrrs {rd_name}, 0x{csr:03x}, {rs1_name}"
-                elif funct3 == isa.CSR_F3["CSRRC"]:
-                    return "CSRRC", f"csrrc {rd_name}, 0x{csr:03x}, {rs1_name}"
-                elif funct3 == isa.CSR_F3["CSRRWI"]:
-                    return "CSRRWI", f"csrrwi {rd_name}, 0x{csr:03x}, {rs1}"
-                elif funct3 == isa.CSR_F3["CSRRSI"]:
-                    return "CSRRSI", f"csrrsi {rd_name}, 0x{csr:03x}, {rs1}"
-                elif funct3 == isa.CSR_F3["CSRRCI"]:
-                    return "CSRRCI", f"csrrci {rd_name}, 0x{csr:03x}, {rs1}"
+    if inst == 0x73:
+        return "ECALL", "ecall"
+
+    if inst == 0x30200073:
+        return "MRET", "mret"
+
+    # Check if valid instruction
+    if (inst & 0x3) != 0x3:
+        return "INVALID", f"invalid instruction (0x{inst:08x})"
+
+    # Fixed-position fields inlined as shift/mask expressions; the
+    # get_bits helper costs a Python call per field
+    opcode = (inst >> 2) & 0x1F
+    funct3 = (inst >> 12) & 0x7
+    funct7 = (inst >> 25) & 0x7F
+    rd = (inst >> 7) & 0x1F
+    rs1 = (inst >> 15) & 0x1F
+    rs2 = (inst >> 20) & 0x1F
+    imm = decode_imm(opcode, inst)
+
+    # Convert to signed for display
+    imm_signed = imm - (1 << 32) if imm & 0x80000000 else imm
 
+    handler = _DISPATCH.get(opcode)
+    if handler is not None:
+        try:
+            result = handler(inst, rd, rs1, rs2, funct3, funct7,
+                             imm_signed)
         except Exception:
-            pass
+            result = None
+        if result is not None:
+            return result
+
+    return "UNKNOWN", f"unknown instruction (0x{inst:08x})"
+
+
+class Disassembler:
+    """Disassembles RISC-V instructions into human-readable format.
+
+    Compatibility shim: the implementation lives in the module-level
+    functions above.
+    """
+
+    REG_ABI_NAMES = REG_ABI_NAMES
+    _REG_DISPLAY = _REG_DISPLAY
 
-        return "UNKNOWN", f"unknown instruction (0x{inst:08x})"
+    reg_name = staticmethod(reg_name)
+    decode_imm = staticmethod(decode_imm)
+    disassemble = staticmethod(disassemble)
@@ -4,39 +4,96 @@ This module provides detailed cycle-by-cycle logging for learning purposes,
 showing the state of all pipeline stages, registers, and control signals.
 """
 
-from pyv.disassembler import Disassembler
+import sys
+
+from pyv.disassembler import Disassembler, disassemble
 from pyv.stages import LOAD, STORE
 
+# Writeback-source and memory-op display names, hoisted so the per-cycle
+# loggers do a tuple index / dict lookup instead of rebuilding a list
+# (and re-evaluating a conditional chain) every cycle
+_WB_SRC_NAMES = ("ALU", "PC+4", "MEM", "CSR", "?")
+_MEM_OP_NAMES = {LOAD: "LOAD", STORE: "STORE"}
+
 
 class EducationalLogger:
-    """Provides detailed educational logging for the simulator."""
+    """Provides detailed educational logging for the simulator.
 
-    def __init__(self, model):
+    Each cycle block is assembled into a list of strings and emitted
+    with a single stdout write, instead of ~25 print calls (each of
+    which takes the stdout lock and issues its own write).
+    """
+
+    def __init__(self, model, enabled=True):
         """Initialize the logger with a model instance.
 
         Args:
             model: SingleCycleModel or PipelinedModel instance
+            enabled: When False, log_cycle is a no-op — no pipeline
+                register reads, disassembly, or formatting happen.
         """
+        self.enabled = enabled
         self.model = model
         self.core = model.core
         self.cycle = 0
         self.disasm = Disassembler()
 
-    def print_separator(self, char="=", length=80):
-        """Print a separator line."""
-        print(char * length)
+        # Register-dump layout precomputed once: one .format call per
+        # row instead of four f-strings plus string concatenation
+        self._reg_row_tpl = "x{:2d}({:4s})=0x{:08X}  " * 4
+        self._reg_rows = [
+            [(row + col * 8, Disassembler.REG_ABI_NAMES[row + col * 8])
+             for col in range(4)]
+            for row in range(8)
+        ]
+
+        # Bind the per-cycle state reads once; each is a three-deep
+        # attribute chain that would otherwise be re-resolved per signal
+        # per cycle
+        core = self.core
+        self._is_pipelined = hasattr(core, 'ifid_reg')
+        if self._is_pipelined:
+            self._read_pc = core.pc_reg.cur.read
+            self._read_npc = core.npc.read
+            self._read_ir = core.if_stg.ir_reg.cur.read
+            self._read_ifid = core.ifid_reg.IFID_o.read
+            self._read_idex = core.idex_reg.IDEX_o.read
+            self._read_exmem = core.exmem_reg.EXMEM_o.read
+            self._read_memwb = core.memwb_reg.MEMWB_o.read
+            self._read_stall_pc = core.hazard.stall_pc_o.read
+            self._read_stall_ifid = core.hazard.stall_ifid_o.read
+            self._read_flush_ifid = core.hazard.flush_ifid_o.read
+            self._read_flush_idex = core.hazard.flush_idex_o.read
+        else:
+            self._read_pc = core.if_stg.pc_reg.cur.read
+            self._read_ir = core.if_stg.ir_reg.cur.read
+            self._read_ifid = core.if_stg.IFID_o.read
+            self._read_idex = core.id_stg.IDEX_o.read
+            self._read_exmem = core.ex_stg.EXMEM_o.read
+            self._read_memwb = core.mem_stg.MEMWB_o.read
+
+    def print_separator(self, char="=", length=80, buf=None):
+        """Print a separator line (or append it to buf)."""
+        if buf is None:
+            print(char * length)
+        else:
+            buf.append(char * length + "\n")
 
-    def print_header(self, text):
-        """Print a section header."""
-        print(f"\n{'='*80}")
-        print(f"  {text}")
-        print(f"{'='*80}")
+    def print_header(self, text, buf=None):
+        """Print a section header (or append it to buf)."""
+        block = f"\n{'='*80}\n  {text}\n{'='*80}\n"
+        if buf is None:
+            sys.stdout.write(block)
+        else:
+            buf.append(block)
 
-    def print_subheader(self, text):
-        """Print a subsection header."""
-        print(f"\n{'-'*80}")
-        print(f"  {text}")
-        print(f"{'-'*80}")
+    def print_subheader(self, text, buf=None):
+        """Print a subsection header (or append it to buf)."""
+        block = f"\n{'-'*80}\n  {text}\n{'-'*80}\n"
+        if buf is None:
+            sys.stdout.write(block)
+        else:
+            buf.append(block)
 
     def log_cycle(self, cycle_num):
         """Log complete state for one cycle.
@@ -44,77 +101,82 @@ class EducationalLogger:
         Args:
             cycle_num: Current cycle number
         """
+        if not self.enabled:
+            return
         self.cycle = cycle_num
-        self.print_header(f"CYCLE {cycle_num}")
-
-        # Determine if pipelined or single-cycle
-        is_pipelined = hasattr(self.core, 'ifid_reg')
+        buf = []
+        self.print_header(f"CYCLE {cycle_num}", buf)
 
-        if is_pipelined:
-            self._log_pipelined_cycle()
+        if self._is_pipelined:
+            self._log_pipelined_cycle(buf)
         else:
-            self._log_singlecycle_cycle()
+            self._log_singlecycle_cycle(buf)
 
         # Always show register file
-        self._log_registers()
+        self._log_registers(buf)
 
-        print()  # Blank line after cycle
+        buf.append("\n")  # Blank line after cycle
+        sys.stdout.write("".join(buf))
 
-    def _log_singlecycle_cycle(self):
+    def _log_singlecycle_cycle(self, buf):
         """Log single-cycle CPU state."""
+        if not self.enabled:
+            return
         # PC and instruction
-        pc = self.core.if_stg.pc_reg.cur.read()
-        inst = self.core.if_stg.ir_reg.cur.read()
+        pc = self._read_pc()
+        inst = self._read_ir()
 
-        print(f"\nPC: 0x{pc:08X}")
-        mnemonic, desc = self.disasm.disassemble(inst)
-        print(f"Instruction: 0x{inst:08X}  [{mnemonic}] {desc}")
+        buf.append(f"\nPC: 0x{pc:08X}\n")
+        mnemonic, desc = disassemble(inst)
+        buf.append(f"Instruction: 0x{inst:08X}  [{mnemonic}] {desc}\n")
 
         # All 5 stages execute in same cycle for single-cycle
-        self.print_subheader("Pipeline Stages (All execute in same cycle)")
+        self.print_subheader("Pipeline Stages (All execute in same cycle)", buf)
 
         # IF Stage
-        print(f"[IF] PC=0x{pc:08X}, IR=0x{inst:08X}")
+        buf.append(f"[IF] PC=0x{pc:08X}, IR=0x{inst:08X}\n")
 
         # ID Stage
-        ifid = self.core.if_stg.IFID_o.read()
-        idex = self.core.id_stg.IDEX_o.read()
-        print(f"[ID] rs1=x{idex.rs1 & 0xFFFFFFFF:08X}, rs2=x{idex.rs2 & 0xFFFFFFFF:08X}, "
-              f"imm={idex.imm:08X}, rd=x{idex.rd}, we={idex.we}, wb_sel={idex.wb_sel}")
-        print(f"     Control: mem={idex.mem}, opcode=0x{idex.opcode:02X}, "
-              f"funct3=0x{idex.funct3:X}, funct7=0x{idex.funct7:02X}")
+        ifid = self._read_ifid()
+        idex = self._read_idex()
+        buf.append(f"[ID] rs1=x{idex.rs1 & 0xFFFFFFFF:08X}, rs2=x{idex.rs2 & 0xFFFFFFFF:08X}, "
+                   f"imm={idex.imm:08X}, rd=x{idex.rd}, we={idex.we}, wb_sel={idex.wb_sel}\n")
+        buf.append(f"     Control: mem={idex.mem}, opcode=0x{idex.opcode:02X}, "
+                   f"funct3=0x{idex.funct3:X}, funct7=0x{idex.funct7:02X}\n")
 
         # EX Stage
-        exmem = self.core.ex_stg.EXMEM_o.read()
-        print(f"[EX] ALU Result=0x{exmem.alu_res & 0xFFFFFFFF:08X}, "
-              f"take_branch={exmem.take_branch}, PC+4=0x{exmem.pc4:08X}")
+        exmem = self._read_exmem()
+        buf.append(f"[EX] ALU Result=0x{exmem.alu_res & 0xFFFFFFFF:08X}, "
+                   f"take_branch={exmem.take_branch}, PC+4=0x{exmem.pc4:08X}\n")
 
         # MEM Stage
-        memwb = self.core.mem_stg.MEMWB_o.read()
-        mem_op = "LOAD" if exmem.mem == LOAD else ("STORE" if exmem.mem == STORE else "NONE")
-        print(f"[MEM] Operation={mem_op}, Addr=0x{exmem.alu_res & 0xFFFFFFFF:08X}, "
-              f"Data=0x{memwb.mem_rdata & 0xFFFFFFFF:08X}")
+        memwb = self._read_memwb()
+        mem_op = _MEM_OP_NAMES.get(exmem.mem, "NONE")
+        buf.append(f"[MEM] Operation={mem_op}, Addr=0x{exmem.alu_res & 0xFFFFFFFF:08X}, "
+                   f"Data=0x{memwb.mem_rdata & 0xFFFFFFFF:08X}\n")
 
         # WB Stage
-        wb_src = ["ALU", "PC+4", "MEM", "CSR"][memwb.wb_sel] if memwb.wb_sel < 4 else "?"
-        print(f"[WB] rd=x{memwb.rd}, we={memwb.we}, wb_sel={wb_src}, "
-              f"value=0x{self._get_wb_value(memwb) & 0xFFFFFFFF:08X}")
+        wb_src = _WB_SRC_NAMES[memwb.wb_sel if memwb.wb_sel < 4 else 4]
+        buf.append(f"[WB] rd=x{memwb.rd}, we={memwb.we}, wb_sel={wb_src}, "
+                   f"value=0x{self._get_wb_value(memwb) & 0xFFFFFFFF:08X}\n")
 
-    def _log_pipelined_cycle(self):
+    def _log_pipelined_cycle(self, buf):
         """Log pipelined CPU state showing all stages simultaneously."""
-        self.print_subheader("Pipeline Stages (Concurrent Execution)")
+        if not self.enabled:
+            return
+        self.print_subheader("Pipeline Stages (Concurrent Execution)", buf)
 
         # Get pipeline register contents
-        ifid = self.core.ifid_reg.IFID_o.read()
-        idex = self.core.idex_reg.IDEX_o.read()
-        exmem = self.core.exmem_reg.EXMEM_o.read()
-        memwb = self.core.memwb_reg.MEMWB_o.read()
+        ifid = self._read_ifid()
+        idex = self._read_idex()
+        exmem = self._read_exmem()
+        memwb = self._read_memwb()
 
         # Hazard signals
-        stall_pc = self.core.hazard.stall_pc_o.read()
-        stall_ifid = self.core.hazard.stall_ifid_o.read()
-        flush_ifid = self.core.hazard.flush_ifid_o.read()
-        flush_idex = self.core.hazard.flush_idex_o.read()
+        stall_pc = self._read_stall_pc()
+        stall_ifid = self._read_stall_ifid()
+        flush_ifid = self._read_flush_ifid()
+        flush_idex = self._read_flush_idex()
 
         # Show hazard status
         hazard_str = ""
@@ -123,64 +185,64 @@ class EducationalLogger:
         if flush_ifid or flush_idex:
             hazard_str += " [FLUSH]"
         if hazard_str:
-            print(f"\nHazard Status:{hazard_str}")
+            buf.append(f"\nHazard Status:{hazard_str}\n")
             if stall_pc:
-                print("  - PC stalled")
+                buf.append("  - PC stalled\n")
             if flush_ifid:
-                print("  - IF/ID flushed (bubble inserted)")
+                buf.append("  - IF/ID flushed (bubble inserted)\n")
             if flush_idex:
-                print("  - ID/EX flushed (bubble inserted)")
+                buf.append("  - ID/EX flushed (bubble inserted)\n")
 
         # IF Stage (current)
-        pc = self.core.pc_reg.cur.read()
-        npc = self.core.npc.read()
-        inst_fetching = self.core.if_stg.ir_reg.cur.read()
-        print(f"\n[IF] PC=0x{pc:08X} -> NPC=0x{npc:08X}")
-        mnemonic, desc = self.disasm.disassemble(inst_fetching)
-        print(f"     Fetching: 0x{inst_fetching:08X} [{mnemonic}] {desc}")
+        pc = self._read_pc()
+        npc = self._read_npc()
+        inst_fetching = self._read_ir()
+        buf.append(f"\n[IF] PC=0x{pc:08X} -> NPC=0x{npc:08X}\n")
+        mnemonic, desc = disassemble(inst_fetching)
+        buf.append(f"     Fetching: 0x{inst_fetching:08X} [{mnemonic}] {desc}\n")
 
         # ID Stage (IF/ID register)
-        print(f"\n[ID] PC=0x{ifid.pc:08X}")
-        mnemonic, desc = self.disasm.disassemble(ifid.inst)
-        print(f"     Decoding: 0x{ifid.inst:08X} [{mnemonic}] {desc}")
+        buf.append(f"\n[ID] PC=0x{ifid.pc:08X}\n")
+        mnemonic, desc = disassemble(ifid.inst)
+        buf.append(f"     Decoding: 0x{ifid.inst:08X} [{mnemonic}] {desc}\n")
         if idex.we:
-            print(f"     Outputs: rs1=0x{idex.rs1 & 0xFFFFFFFF:08X}, "
-                  f"rs2=0x{idex.rs2 & 0xFFFFFFFF:08X}, imm=0x{idex.imm & 0xFFFFFFFF:08X}")
-            print(f"     Control: rd=x{idex.rd}, we={idex.we}, wb_sel={idex.wb_sel}, "
-                  f"mem={idex.mem}")
+            buf.append(f"     Outputs: rs1=0x{idex.rs1 & 0xFFFFFFFF:08X}, "
+                       f"rs2=0x{idex.rs2 & 0xFFFFFFFF:08X}, imm=0x{idex.imm & 0xFFFFFFFF:08X}\n")
+            buf.append(f"     Control: rd=x{idex.rd}, we={idex.we}, wb_sel={idex.wb_sel}, "
+                       f"mem={idex.mem}\n")
 
         # EX Stage (ID/EX register)
-        print(f"\n[EX] PC=0x{idex.pc:08X}")
+        buf.append(f"\n[EX] PC=0x{idex.pc:08X}\n")
         if idex.we or idex.mem:
-            print(f"     ALU: op1=0x{idex.rs1 & 0xFFFFFFFF:08X}, "
-                  f"op2=0x{idex.imm & 0xFFFFFFFF:08X} (or rs2=0x{idex.rs2 & 0xFFFFFFFF:08X})")
-            print(f"     Result: 0x{exmem.alu_res & 0xFFFFFFFF:08X}, "
-                  f"take_branch={exmem.take_branch}")
+            buf.append(f"     ALU: op1=0x{idex.rs1 & 0xFFFFFFFF:08X}, "
+                       f"op2=0x{idex.imm & 0xFFFFFFFF:08X} (or rs2=0x{idex.rs2 & 0xFFFFFFFF:08X})\n")
+            buf.append(f"     Result: 0x{exmem.alu_res & 0xFFFFFFFF:08X}, "
+                       f"take_branch={exmem.take_branch}\n")
         else:
-            print(f"     [BUBBLE - No operation]")
+            buf.append("     [BUBBLE - No operation]\n")
 
         # MEM Stage (EX/MEM register)
-        print(f"\n[MEM]")
+        buf.append("\n[MEM]\n")
         if exmem.mem == LOAD:
-            print(f"     LOAD from addr=0x{exmem.alu_res & 0xFFFFFFFF:08X}, "
-                  f"data=0x{memwb.mem_rdata & 0xFFFFFFFF:08X}")
+            buf.append(f"     LOAD from addr=0x{exmem.alu_res & 0xFFFFFFFF:08X}, "
+                       f"data=0x{memwb.mem_rdata & 0xFFFFFFFF:08X}\n")
         elif exmem.mem == STORE:
-            print(f"     STORE to addr=0x{exmem.alu_res & 0xFFFFFFFF:08X}, "
-                  f"data=0x{exmem.rs2 & 0xFFFFFFFF:08X}")
+            buf.append(f"     STORE to addr=0x{exmem.alu_res & 0xFFFFFFFF:08X}, "
+                       f"data=0x{exmem.rs2 & 0xFFFFFFFF:08X}\n")
         else:
             if exmem.we:
-                print(f"     No memory operation (pass-through ALU result=0x{exmem.alu_res & 0xFFFFFFFF:08X})")
+                buf.append(f"     No memory operation (pass-through ALU result=0x{exmem.alu_res & 0xFFFFFFFF:08X})\n")
             else:
-                print(f"     [BUBBLE - No operation]")
+                buf.append("     [BUBBLE - No operation]\n")
 
         # WB Stage (MEM/WB register)
-        print(f"\n[WB]")
+        buf.append("\n[WB]\n")
         if memwb.we:
-            wb_src = ["ALU", "PC+4", "MEM", "CSR"][memwb.wb_sel] if memwb.wb_sel < 4 else "?"
+            wb_src = _WB_SRC_NAMES[memwb.wb_sel if memwb.wb_sel < 4 else 4]
             wb_val = self._get_wb_value(memwb)
-            print(f"     Writing x{memwb.rd} = 0x{wb_val & 0xFFFFFFFF:08X} (source: {wb_src})")
+            buf.append(f"     Writing x{memwb.rd} = 0x{wb_val & 0xFFFFFFFF:08X} (source: {wb_src})\n")
         else:
-            print(f"     [BUBBLE - No writeback]")
+            buf.append("     [BUBBLE - No writeback]\n")
 
     def _get_wb_value(self, memwb):
         """Get the value that will be written back."""
@@ -194,19 +256,22 @@ class EducationalLogger:
             return memwb.csr_read_val
         return 0
 
-    def _log_registers(self):
+    def _log_registers(self, buf):
         """Log all register values."""
-        self.print_subheader("Register File (x0-x31)")
-
-        # Print in 4 columns for compact display
-        for row in range(8):
-            line = ""
-            for col in range(4):
-                reg_num = row + col * 8
-                reg_val = self.core.regf.read(reg_num)
-                reg_name = self.disasm.REG_ABI_NAMES[reg_num]
-                line += f"x{reg_num:2d}({reg_name:4s})=0x{reg_val & 0xFFFFFFFF:08X}  "
-            print(line)
+        if not self.enabled:
+            return
+        self.print_subheader("Register File (x0-x31)", buf)
+
+        # Print in 4 columns for compact display. One bulk read per
+        # cycle instead of 32 read() calls (each of which logs a debug
+        # line and re-resolves the regfile attribute chain)
+        regs = self.core.regf.read_range(0, 32)
+        tpl = self._reg_row_tpl
+        for row in self._reg_rows:
+            args = []
+            for reg_num, reg_name in row:
+                args += (reg_num, reg_name, regs[reg_num] & 0xFFFFFFFF)
+            buf.append(tpl.format(*args) + "\n")
 
     def log_summary(self, total_cycles, elapsed_time):
         """Log execution summary.
@@ -215,25 +280,24 @@ class EducationalLogger:
             total_cycles: Total number of cycles executed
             elapsed_time: Wall clock time in seconds
         """
-        self.print_header("EXECUTION SUMMARY")
-        print(f"Total Cycles: {total_cycles}")
-        print(f"Wall Clock Time: {elapsed_time:.4f} seconds")
-        print(f"Simulation Speed: {total_cycles/elapsed_time:.2f} cycles/second")
+        buf = []
+        self.print_header("EXECUTION SUMMARY", buf)
+        buf.append(f"Total Cycles: {total_cycles}\n")
+        buf.append(f"Wall Clock Time: {elapsed_time:.4f} seconds\n")
+        buf.append(f"Simulation Speed: {total_cycles/elapsed_time:.2f} cycles/second\n")
 
         # Final PC
-        pc = self.core.pc_reg.cur.read() if hasattr(self.core, 'pc_reg') else \
-             self.core.if_stg.pc_reg.cur.read()
-        print(f"Final PC: 0x{pc:08X}")
+        buf.append(f"Final PC: 0x{self._read_pc():08X}\n")
 
         # Show some interesting final register values
-        print("\nFinal Register Values (non-zero):")
-        for i in range(32):
-            val = self.core.regf.read(i)
+        buf.append("\nFinal Register Values (non-zero):\n")
+        for i, val in enumerate(self.core.regf.read_range(0, 32)):
             if val != 0:
                 reg_name = self.disasm.REG_ABI_NAMES[i]
-                print(f"  x{i:2d}({reg_name:4s}) = 0x{val & 0xFFFFFFFF:08X} ({val})")
+                buf.append(f"  x{i:2d}({reg_name:4s}) = 0x{val & 0xFFFFFFFF:08X} ({val})\n")
 
-        print(f"\n{'='*80}\n")
+        buf.append(f"\n{'='*80}\n\n")
+        sys.stdout.write("".join(buf))
 
     def interactive_prompt(self):
         """Show interactive prompt and wait for user input.
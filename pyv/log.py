@@ -1,9 +1,11 @@
+import atexit
 import logging
+import logging.handlers
 import os
 
 
 def getLogger(verbose=False, log_file="run.log"):
-    """Get or configure the logger.
+    """Configure the logger for an enabled logging session.
 
     Args:
         verbose (bool): If True, enable console logging and set to DEBUG level
@@ -30,11 +32,18 @@ def getLogger(verbose=False, log_file="run.log"):
     )
     simple_formatter = logging.Formatter('%(levelname)-8s: %(message)s')
 
-    # File handler - always log to file
+    # File handler - always log to file. Records are buffered in memory
+    # and flushed to disk in batches so a verbose run pays one write()
+    # per few thousand log lines instead of one per line; errors flush
+    # immediately, and an atexit hook drains whatever is left on exit.
     file_handler = logging.FileHandler(log_file, 'w')
     file_handler.setFormatter(detailed_formatter)
     file_handler.setLevel(logging.DEBUG)  # Log everything to file
-    logger.addHandler(file_handler)
+    buffered_handler = logging.handlers.MemoryHandler(
+        capacity=8192, flushLevel=logging.ERROR, target=file_handler)
+    buffered_handler.setLevel(logging.DEBUG)
+    logger.addHandler(buffered_handler)
+    atexit.register(buffered_handler.flush)
 
     # Console handler - only if verbose
     if verbose:
@@ -46,8 +55,18 @@ def getLogger(verbose=False, log_file="run.log"):
     return logger
 
 
-# Default logger instance (disabled by default)
-logger = getLogger(verbose=False)
+# Default logger instance: disabled. Only a NullHandler and a WARNING
+# threshold are installed, so importing pyv neither creates nor
+# truncates run.log, and a dropped debug call costs one level compare
+# instead of a format pass plus handler dispatch. The file handler is
+# only attached once `enable_logging` is called.
+#
+# Note for hot-path callers: pass lazy %-style arguments
+# (logger.debug("pc=%x", pc)) rather than f-strings, otherwise the
+# string is built even when the record is dropped.
+logger = logging.getLogger("pyv")
+logger.addHandler(logging.NullHandler())
+logger.setLevel(logging.WARNING)
 
 
 def enable_logging(verbose=False, log_file="run.log"):
@@ -59,8 +59,10 @@ class Memory(Module, Clocked):
         """
         super().__init__(name='UnnamedMemory')
         MemList.add_to_mem_list(self)
-        self.mem = [0 for i in range(0, size)]
-        """Memory array. List of length `size`."""
+        self.mem = bytearray(size)
+        """Memory array. `bytearray` of length `size`: one machine byte
+        per element instead of a boxed Python int, so bulk loads are a
+        single C-level copy."""
 
         # Read port 0
         self.read_port0 = ReadPort(
@@ -108,12 +110,40 @@ class Memory(Module, Clocked):
                 raise Exception(
                     f'ERROR (Memory ({self.name}), read): Invalid width {w}')
 
-            logger.debug(f"MEM ({self.name}): read value {val:08X} from address {addr:08X}")  # noqa: E501
+            logger.debug("MEM (%s): read value %08X from address %08X", self.name, val, addr)  # noqa: E501
         except IndexError:
             val = 0
 
         return val
 
+    def view(self, addr, nbytes):
+        """Returns a contiguous range of memory as one slice.
+
+        Bulk accessor for tooling (model memory dumps, result reads):
+        a single C-level slice instead of one indexed read per byte.
+
+        Args:
+            addr: Address of first byte.
+            nbytes: Number of bytes to return.
+
+        Returns:
+            The raw bytes `[addr, addr + nbytes)`.
+        """
+        return self.mem[addr:addr + nbytes]
+
+    def load_bytes(self, offset: int, data: bytes):
+        """Installs a block of bytes into memory.
+
+        Bulk counterpart to `view()`: one slice assignment instead of a
+        per-byte Python loop, used by the models when loading program
+        binaries.
+
+        Args:
+            offset: Address of the first byte to write.
+            data: The bytes to install.
+        """
+        self.mem[offset:offset + len(data)] = data
+
     def _process_read(self, read_port):
         re = read_port.re_i.read()
         addr = read_port.addr_i.read()
@@ -152,7 +182,7 @@ class Memory(Module, Clocked):
                 raise Exception(
                     f'ERROR (Memory ({self.name}), write): Invalid width {w}')
             logger.debug(
-                f"MEM {self.name}: write {wdata:08X} to address {addr:08X}")
+                "MEM %s: write %08X to address %08X", self.name, wdata, addr)
 
             if w == 1:  # byte
                 self.mem[addr] = 0xff & wdata
@@ -54,6 +54,17 @@ class Model:
         """
         self.sim.run(num_cycles)
 
+    def run_block(self, num_cycles: int = 256):
+        """Runs a block of cycles without resetting registers.
+
+        Callers batching execution should reset once (via
+        `self.sim.reset()`) and then invoke this in a loop.
+
+        Args:
+            num_cycles (int, optional): Number of cycles in the block.
+        """
+        self.sim.run_block(num_cycles)
+
     def get_cycles(self):
         """Get number cycles executed.
 
@@ -1,8 +1,11 @@
 """Pipelined RISC-V CPU model."""
 
+import struct
+
 from pyv.csr import CSRUnit
 from pyv.exception_unit import ExceptionUnit
-from pyv.stages import IFStage, IDStage, EXStage, MEMStage, WBStage, BranchUnit
+from pyv.stages import EXMEM_t, IFStage, IDStage, EXStage, MEMStage, \
+    WBStage, BranchUnit
 from pyv.pipeline_regs import IFIDReg, IDEXReg, EXMEMReg, MEMWBReg
 from pyv.hazard import HazardUnit
 from pyv.mem import Memory
@@ -25,7 +28,8 @@ class Pipelined(Module):
     - WB: Write Back
 
     Features:
-    - Hazard detection with stalling (no forwarding)
+    - Operand forwarding (EX/MEM and MEM/WB bypasses)
+    - Hazard detection with stalling (load-use only)
     - Branch/jump flushing
     - Educational logging support
     """
@@ -46,7 +50,7 @@ class Pipelined(Module):
         """Instruction Fetch"""
         self.id_stg = IDStage(self.regf, self.csr_unit)
         """Instruction Decode"""
-        self.ex_stg = EXStage()
+        self.ex_stg = EXStage(self.regf)
         """Execute"""
         self.mem_stg = MEMStage(self.mem.read_port0, self.mem.write_port)
         """Memory stage"""
@@ -75,19 +79,31 @@ class Pipelined(Module):
         self.pc_reg = Reg(int, -4)
         """Program counter"""
 
-        # Wires for interconnection
-        self.pc = Wire(int)
-        self.npc = Wire(int)
-        self.stall_pc = Wire(bool)
-        self.take_branch = Wire(bool, [self.connects])
-        self.alu_res = Wire(int, [self.connects])
+        # Wires for interconnection. `connects` has to re-run whenever
+        # the PC inputs (next PC, stall) or the registered EX/MEM output
+        # change, so those wires carry it in their sensitivity lists.
+        self.pc = Wire(int, [self.connects])
+        self.npc = Wire(int, [self.connects])
+        self.fetch_addr = Wire(int)
+        self.stall_pc = Wire(bool, [self.connects])
+        self.exmem_w = Wire(EXMEM_t, [self.connects])
+        self.take_branch = Wire(bool)
+        self.alu_res = Wire(int)
+
+        # Branch decisions are tapped off the EX stage *before* the
+        # EX/MEM register: the redirect and the flushes must take effect
+        # in the same cycle the branch executes, otherwise the wrong-path
+        # instruction behind it enters EX before the bubble arrives.
+        self.exmem_w << self.ex_stg.EXMEM_o
 
         # Connect PC
         self.pc << self.pc_reg.cur
         self.npc << self.bu.npc_o
 
-        # Connect IF stage
-        self.if_stg.npc_i << self.npc
+        # Connect IF stage. The fetch address goes through the stall mux
+        # in `connects`: during a stall the same word has to be fetched
+        # again, or the instruction in flight would be lost.
+        self.if_stg.npc_i << self.fetch_addr
 
         # Connect IF/ID pipeline register
         self.ifid_reg.IFID_i << self.if_stg.IFID_o
@@ -96,6 +112,7 @@ class Pipelined(Module):
 
         # Connect ID stage
         self.id_stg.IFID_i << self.ifid_reg.IFID_o
+        self.id_stg.flush_i << self.hazard.flush_ifid_o
 
         # Connect ID/EX pipeline register
         self.idex_reg.IDEX_i << self.id_stg.IDEX_o
@@ -104,6 +121,10 @@ class Pipelined(Module):
 
         # Connect EX stage
         self.ex_stg.IDEX_i << self.idex_reg.IDEX_o
+        self.ex_stg.fwd_a_i << self.hazard.fwd_a_o
+        self.ex_stg.fwd_b_i << self.hazard.fwd_b_o
+        self.ex_stg.fwd_a_val_i << self.hazard.fwd_a_val_o
+        self.ex_stg.fwd_b_val_i << self.hazard.fwd_b_val_o
 
         # Connect EX/MEM pipeline register
         self.exmem_reg.EXMEM_i << self.ex_stg.EXMEM_o
@@ -148,21 +169,36 @@ class Pipelined(Module):
         self.hazard.IFID_i << self.ifid_reg.IFID_o
         self.hazard.IDEX_i << self.idex_reg.IDEX_o
         self.hazard.EXMEM_i << self.exmem_reg.EXMEM_o
+        self.hazard.MEMWB_i << self.memwb_reg.MEMWB_o
         self.hazard.take_branch_i << self.take_branch
         self.stall_pc << self.hazard.stall_pc_o
 
+        # Bound-method caches for `connects`, which runs several times
+        # per cycle: saves the attribute-chain lookups on the hot path.
+        self._read_stall_pc = self.stall_pc.read
+        self._read_pc = self.pc.read
+        self._read_npc = self.npc.read
+        self._read_exmem = self.exmem_w.read
+        self._write_pc_next = self.pc_reg.next.write
+        self._write_fetch_addr = self.fetch_addr.write
+        self._write_take_branch = self.take_branch.write
+        self._write_alu_res = self.alu_res.write
+
     def connects(self):
         """Update PC register with stall control."""
-        stall = self.stall_pc.read()
-
-        if not stall:
-            # Update PC
-            self.pc_reg.next.write(self.npc.read())
+        if self._read_stall_pc():
+            # Hold the PC and refetch the current word during a stall
+            fetch_addr = self._read_pc()
+        else:
+            # Normal operation: advance to the next PC
+            fetch_addr = self._read_npc()
+        self._write_pc_next(fetch_addr)
+        self._write_fetch_addr(fetch_addr)
 
         # Update internal signals
-        exmem = self.exmem_reg.EXMEM_o.read()
-        self.take_branch.write(exmem.take_branch)
-        self.alu_res.write(exmem.alu_res)
+        exmem = self._read_exmem()
+        self._write_take_branch(exmem.take_branch)
+        self._write_alu_res(exmem.alu_res)
 
 
 class PipelinedModel(Model):
@@ -192,7 +228,8 @@ class PipelinedModel(Model):
         Args:
             instructions (list): List of instruction words.
         """
-        self.core.mem.mem[:len(instructions)] = instructions
+        self.core.mem.load_bytes(
+            0, struct.pack(f'<{len(instructions)}I', *instructions))
 
     def load_binary(self, file):
         """Load a program binary into the instruction memory.
@@ -200,12 +237,10 @@ class PipelinedModel(Model):
         Args:
             file (string): Path to the binary.
         """
-        f = open(file, 'rb')
-        ba = bytearray(f.read())
-        f.close()
-        inst = list(ba)
-
-        self.core.mem.mem[:len(inst)] = inst
+        # Stream the file straight into the memory bytearray: no
+        # intermediate bytes object, one read into final storage.
+        with open(file, 'rb') as f:
+            f.readinto(memoryview(self.core.mem.mem))
 
     def readReg(self, reg):
         """Read a register in the register file.
@@ -236,7 +271,9 @@ class PipelinedModel(Model):
         Returns:
             list: List of bytes.
         """
-        return [hex(self.core.mem.mem[addr + i]) for i in range(0, nbytes)]
+        # One C-level bytes->hex pass, then split into per-byte strings
+        buf = self.core.mem.view(addr, nbytes).hex()
+        return ['0x' + buf[i:i + 2] for i in range(0, len(buf), 2)]
 
     def readInstMem(self, addr, nbytes):
         """Read bytes from instruction memory.
@@ -248,4 +285,6 @@ class PipelinedModel(Model):
         Returns:
             list: List of bytes.
         """
-        return [hex(self.core.mem.mem[addr + i]) for i in range(0, nbytes)]
+        # One C-level bytes->hex pass, then split into per-byte strings
+        buf = self.core.mem.view(addr, nbytes).hex()
+        return ['0x' + buf[i:i + 2] for i in range(0, len(buf), 2)]
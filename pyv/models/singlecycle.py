@@ -1,3 +1,5 @@
+import struct
+
 from pyv.csr import CSRUnit
 from pyv.exception_unit import ExceptionUnit
 from pyv.stages import EXMEM_t, IFID_t, IFStage, IDStage, EXStage, MEMStage, \
@@ -108,7 +110,8 @@ class SingleCycleModel(Model):
         Args:
             instructions (list): List of instruction words.
         """
-        self.core.mem.mem[:len(instructions)] = instructions
+        self.core.mem.load_bytes(
+            0, struct.pack(f'<{len(instructions)}I', *instructions))
 
     def load_binary(self, file):
         """Load a program binary into the instruction memory.
@@ -116,12 +119,10 @@ class SingleCycleModel(Model):
         Args:
             file (string): Path to the binary.
         """
-        f = open(file, 'rb')
-        ba = bytearray(f.read())
-        f.close()
-        inst = list(ba)
-
-        self.core.mem.mem[:len(inst)] = inst
+        # Stream the file straight into the memory bytearray: no
+        # intermediate bytes object, one read into final storage.
+        with open(file, 'rb') as f:
+            f.readinto(memoryview(self.core.mem.mem))
 
     def readReg(self, reg):
         """Read a register in the register file.
@@ -152,7 +153,9 @@ class SingleCycleModel(Model):
         Returns:
             list: List of bytes.
         """
-        return [hex(self.core.mem.mem[addr + i]) for i in range(0, nbytes)]
+        # One C-level bytes->hex pass, then split into per-byte strings
+        buf = self.core.mem.view(addr, nbytes).hex()
+        return ['0x' + buf[i:i + 2] for i in range(0, len(buf), 2)]
 
     def readInstMem(self, addr, nbytes):
         """Read bytes from instruction memory.
@@ -164,4 +167,6 @@ class SingleCycleModel(Model):
         Returns:
             list: List of bytes.
         """
-        return [hex(self.core.mem.mem[addr + i]) for i in range(0, nbytes)]
+        # One C-level bytes->hex pass, then split into per-byte strings
+        buf = self.core.mem.view(addr, nbytes).hex()
+        return ['0x' + buf[i:i + 2] for i in range(0, len(buf), 2)]
@@ -3,157 +3,105 @@
 from pyv.module import Module
 from pyv.port import Input, Output
 from pyv.reg import Reg
-from pyv.stages import IFID_t, IDEX_t, EXMEM_t, MEMWB_t
+from pyv.stages import IFID_t, IDEX_t, EXMEM_t, MEMWB_t, NOP_INST
 
+# Singleton bubble payloads written on every flush (and used as reset
+# values). Rebuilding a fresh dataclass per flush allocates an object
+# per stage per bubble cycle; sharing is safe because Reg deep-copies a
+# changed next value before latching it and no consumer mutates a
+# payload it read from a port.
+_IFID_BUBBLE = IFID_t(inst=NOP_INST, pc=-4)
+_IDEX_BUBBLE = IDEX_t()
+_EXMEM_BUBBLE = EXMEM_t()
+_MEMWB_BUBBLE = MEMWB_t()
 
-class IFIDReg(Module):
-    """Pipeline register between IF and ID stages.
 
-    Inputs:
-        IFID_i: Data from IF stage
-        stall_i: Stall signal (hold current value)
-        flush_i: Flush signal (insert bubble/NOP)
-
-    Outputs:
-        IFID_o: Registered data to ID stage
-    """
-
-    def __init__(self):
-        super().__init__()
-        self.IFID_i = Input(IFID_t)
-        self.stall_i = Input(bool)
-        self.flush_i = Input(bool)
-        self.IFID_o = Output(IFID_t)
-
-        # Internal register
-        self.reg = Reg(IFID_t, IFID_t(inst=0x00000013, pc=-4))
+class PipeReg(Module):
+    """Generic pipeline register with stall/flush control.
 
-        # Connect output to register
-        self.IFID_o << self.reg.cur
-
-    def process(self):
-        """Update register based on stall/flush signals."""
-        stall = self.stall_i.read()
-        flush = self.flush_i.read()
-
-        if flush:
-            # Insert NOP
-            self.reg.next.write(IFID_t(inst=0x00000013, pc=-4))
-        elif not stall:
-            # Normal operation: latch input
-            self.reg.next.write(self.IFID_i.read())
-        # else: stall = keep current value (don't write to reg.next)
-
-
-class IDEXReg(Module):
-    """Pipeline register between ID and EX stages.
+    All four pipeline registers share the same control structure; only
+    the payload type and the bubble payload differ, so the behavior
+    lives here once and the stage-specific classes below are thin shims
+    that keep the established port names. A single shared `process`
+    body also keeps CPython's inline caches warm across all four
+    register instances.
 
     Inputs:
-        IDEX_i: Data from ID stage
+        data_i: Data from the upstream stage
         stall_i: Stall signal (hold current value)
         flush_i: Flush signal (insert bubble/NOP)
 
     Outputs:
-        IDEX_o: Registered data to EX stage
+        data_o: Registered data to the downstream stage
     """
 
-    def __init__(self):
+    def __init__(self, dtype, bubble):
+        """Create a new pipeline register.
+
+        Args:
+            dtype: Payload dataclass type.
+            bubble: Payload written on flush (and used as reset value).
+        """
         super().__init__()
-        self.IDEX_i = Input(IDEX_t)
+        self.data_i = Input(dtype)
         self.stall_i = Input(bool)
         self.flush_i = Input(bool)
-        self.IDEX_o = Output(IDEX_t)
+        self.data_o = Output(dtype)
+        self._bubble = bubble
 
-        # Internal register - default to NOP-like state
-        self.reg = Reg(IDEX_t, IDEX_t())
+        # Internal register
+        self.reg = Reg(dtype, bubble)
 
         # Connect output to register
-        self.IDEX_o << self.reg.cur
+        self.data_o << self.reg.cur
 
     def process(self):
         """Update register based on stall/flush signals."""
-        stall = self.stall_i.read()
-        flush = self.flush_i.read()
-
-        if flush:
-            # Insert bubble (NOP-like: no write enable)
-            self.reg.next.write(IDEX_t())
-        elif not stall:
+        # A stalled register keeps its value, so bail out before even
+        # touching the other ports. Checking stall first is safe because
+        # stall and flush are never asserted together: a stall requires
+        # a load in EX, and a load is never a taken branch.
+        if self.stall_i.read():
+            return
+        if self.flush_i.read():
+            # Insert bubble
+            self.reg.next.write(self._bubble)
+        else:
             # Normal operation: latch input
-            self.reg.next.write(self.IDEX_i.read())
-
-
-class EXMEMReg(Module):
-    """Pipeline register between EX and MEM stages.
+            self.reg.next.write(self.data_i.read())
 
-    Inputs:
-        EXMEM_i: Data from EX stage
-        stall_i: Stall signal (hold current value)
-        flush_i: Flush signal (insert bubble/NOP)
 
-    Outputs:
-        EXMEM_o: Registered data to MEM stage
-    """
+class IFIDReg(PipeReg):
+    """Pipeline register between IF and ID stages."""
 
     def __init__(self):
-        super().__init__()
-        self.EXMEM_i = Input(EXMEM_t)
-        self.stall_i = Input(bool)
-        self.flush_i = Input(bool)
-        self.EXMEM_o = Output(EXMEM_t)
-
-        # Internal register
-        self.reg = Reg(EXMEM_t, EXMEM_t())
+        super().__init__(IFID_t, _IFID_BUBBLE)
+        self.IFID_i = self.data_i
+        self.IFID_o = self.data_o
 
-        # Connect output to register
-        self.EXMEM_o << self.reg.cur
 
-    def process(self):
-        """Update register based on stall/flush signals."""
-        stall = self.stall_i.read()
-        flush = self.flush_i.read()
+class IDEXReg(PipeReg):
+    """Pipeline register between ID and EX stages."""
 
-        if flush:
-            # Insert bubble
-            self.reg.next.write(EXMEM_t())
-        elif not stall:
-            # Normal operation: latch input
-            self.reg.next.write(self.EXMEM_i.read())
+    def __init__(self):
+        super().__init__(IDEX_t, _IDEX_BUBBLE)
+        self.IDEX_i = self.data_i
+        self.IDEX_o = self.data_o
 
 
-class MEMWBReg(Module):
-    """Pipeline register between MEM and WB stages.
-
-    Inputs:
-        MEMWB_i: Data from MEM stage
-        stall_i: Stall signal (hold current value)
-        flush_i: Flush signal (insert bubble/NOP)
-
-    Outputs:
-        MEMWB_o: Registered data to WB stage
-    """
+class EXMEMReg(PipeReg):
+    """Pipeline register between EX and MEM stages."""
 
     def __init__(self):
-        super().__init__()
-        self.MEMWB_i = Input(MEMWB_t)
-        self.stall_i = Input(bool)
-        self.flush_i = Input(bool)
-        self.MEMWB_o = Output(MEMWB_t)
+        super().__init__(EXMEM_t, _EXMEM_BUBBLE)
+        self.EXMEM_i = self.data_i
+        self.EXMEM_o = self.data_o
 
-        # Internal register
-        self.reg = Reg(MEMWB_t, MEMWB_t())
 
-        # Connect output to register
-        self.MEMWB_o << self.reg.cur
-
-    def process(self):
-        """Update register based on stall/flush signals."""
-        stall = self.stall_i.read()
-        flush = self.flush_i.read()
+class MEMWBReg(PipeReg):
+    """Pipeline register between MEM and WB stages."""
 
-        if flush:
-            # Insert bubble
-            self.reg.next.write(MEMWB_t())
-        elif not stall:
-            # Normal operation: latch input
-            self.reg.next.write(self.MEMWB_i.read())
+    def __init__(self):
+        super().__init__(MEMWB_t, _MEMWB_BUBBLE)
+        self.MEMWB_i = self.data_i
+        self.MEMWB_o = self.data_o
@@ -67,7 +67,7 @@ class PortList:
             ports_to_log = PortList.port_list
 
         for p in ports_to_log:
-            logger.info(f"{p.name}: {p.read()}")
+            logger.info("%s: %s", p.name, p.read())
 
     @staticmethod
     def filter(patterns: list[str]):
@@ -168,10 +168,10 @@ class PortRW(Port, Generic[T]):
     def _propagate(self, oldVal: T, newVal: T):
         """Propagate a value change.
         """
-        logger.debug(f"Port {self.name} changed from {oldVal} to {newVal}.")
+        logger.debug("Port %s changed from %s to %s.", self.name, oldVal, newVal)
 
         for port in self._downstream_inputs:
-            logger.debug(f"Notifying {port.name}")
+            logger.debug("Notifying %s", port.name)
             port._notify()
 
     def _set_root_driver(self, newRoot: Port):
@@ -269,7 +269,7 @@ class Input(PortRW[T]):
         # TODO: Figure out how to log the change before the log of process
         # queue
 
-        # logger.debug(f"Port {self.name} changed from {oldVal} to {newVal}.")
+        # logger.debug("Port %s changed from %s to %s.", self.name, oldVal, newVal)
 
         self._process_method_handler.add_methods_to_sim_queue()
         super()._propagate(oldVal, newVal)
@@ -59,7 +59,7 @@ class Reg(PyVObj, Clocked, Generic[T]):
 
     def _tick(self):
         if self._do_reset:
-            logger.debug(f"Sync reset on register {self.name}. Reset value: {self._reset_val}.")  # noqa: E501
+            logger.debug("Sync reset on register %s. Reset value: %s.", self.name, self._reset_val)  # noqa: E501
             self._reset()
         elif self._do_tick:
             self.cur.write(self._nextv)
@@ -103,12 +103,27 @@ class Regfile(Clocked):
             # because the decoder will only feed-in valid 5 bit indeces.
             try:
                 val = self.regs[reg]
-                logger.debug(f"Regfile READ: x{reg} = {val}")
+                logger.debug("Regfile READ: x%d = %d", reg, val)
             except IndexError:
                 val = 0
 
             return val
 
+    def read_range(self, start: int, stop: int) -> list[int]:
+        """Reads a contiguous range of registers in one slice.
+
+        Args:
+            start (int): Index of first register to read.
+            stop (int): Index one past the last register to read.
+
+        Returns:
+            list[int]: The register values (x0 always reads as 0).
+        """
+        vals = self.regs[start:stop]
+        if start == 0 and vals:
+            vals[0] = 0
+        return vals
+
     def write_request(self, reg: int, val: int):
         """Writes a value to a register.
 
@@ -136,7 +151,7 @@ class Regfile(Clocked):
         if not self.we:
             return
 
-        logger.debug(f"Regfile WRITE: x{self._next_w_idx} changed from {self.regs[self._next_w_idx]} to {self._next_w_val}")  # noqa: E501
+        logger.debug("Regfile WRITE: x%d changed from %d to %d", self._next_w_idx, self.regs[self._next_w_idx], self._next_w_val)  # noqa: E501
         self.regs[self._next_w_idx] = self._next_w_val
 
         # TODO: Technically, it shouldn't be the regfile's responsibility to
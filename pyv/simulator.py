@@ -1,3 +1,5 @@
+import logging
+
 from pyv.port import PortList
 from collections import deque
 from pyv.log import logger
@@ -49,6 +51,10 @@ class Simulator:
 
         self._objs = []
         self._change_queue = deque()
+        # Mirror of the queue's members for O(1) duplicate checks; the
+        # `fn in deque` test is a linear scan and sits on the hot path
+        # of every port write
+        self._change_queue_members = set()
         self._event_queue = _EventQueue()
         self._cycles = 0
 
@@ -86,7 +92,7 @@ class Simulator:
         PortList.filter(probes)
 
     def _log_cycle(self):
-        logger.info(f"\n**** Cycle {self._cycles} ****")
+        logger.info("\n**** Cycle %d ****", self._cycles)
 
     def _log_ports(self):
         PortList.log_ports()
@@ -121,6 +127,38 @@ class Simulator:
         self.run_comb_logic()
         self.tick()
 
+    def _cycle_quiet(self):
+        """Per-cycle dispatch specialized for disabled logging.
+
+        Same sequence as `_cycle`, but with every logging call removed:
+        the cycle banner, the port dump and the per-callback debug
+        message in the change loop. Building and discarding those
+        f-strings dominates the cycle cost once the design itself is
+        cheap, so the quiet run loop uses this method instead (see
+        `_pick_cycle_method`).
+        """
+        self._process_events()
+        queue = self._change_queue
+        members = self._change_queue_members
+        while queue:
+            nextFn = queue.popleft()
+            members.discard(nextFn)
+            nextFn()
+        self._process_onstable_callbacks()
+        Clock.tick()
+        self._cycles += 1
+
+    def _pick_cycle_method(self):
+        """Select the per-cycle method for a run.
+
+        INFO disabled implies DEBUG disabled, so when INFO records are
+        ruled out no logging call in the cycle can produce output and
+        the quiet specialization is exact.
+        """
+        if logger.isEnabledFor(logging.INFO):
+            return self._cycle
+        return self._cycle_quiet
+
     def step(self):
         """Peform a single simulation step (cycle).
         This is method is intended for use in tests.
@@ -154,8 +192,25 @@ class Simulator:
         if reset_regs:
             self.reset()
 
+        cycle = self._pick_cycle_method()
         for i in range(0, num_cycles):
-            self._cycle()
+            cycle()
+        self._process_remaining()
+
+    def run_block(self, num_cycles: int):
+        """Runs a block of cycles without reset or session logging.
+
+        Intended for callers that drive execution in fixed-size blocks
+        (see `Model.run_block`): the per-cycle dispatch method is bound
+        to a local once per block, and the cycle budget is only checked
+        at block boundaries.
+
+        Args:
+            num_cycles (int): Number of cycles in the block.
+        """
+        cycle = self._pick_cycle_method()
+        for _ in range(num_cycles):
+            cycle()
         self._process_remaining()
 
     @staticmethod
@@ -166,9 +221,12 @@ class Simulator:
         Simulator._stable_callbacks = []
 
     def _process_changes(self):
-        while len(self._change_queue) > 0:
-            nextFn = self._change_queue.popleft()
-            logger.debug(f"Running {nextFn.__qualname__}")
+        queue = self._change_queue
+        members = self._change_queue_members
+        while queue:
+            nextFn = queue.popleft()
+            members.discard(nextFn)
+            logger.debug("Running %s", nextFn.__qualname__)
             nextFn()
 
     def _events_pending(self):
@@ -178,7 +236,7 @@ class Simulator:
         while self._events_pending():
             event: Event = self._event_queue.get_next_event()
             callback = event[2]
-            logger.info(f"Triggering event -> {callback.__qualname__}()")
+            logger.info("Triggering event -> %s()", callback.__qualname__)
             callback()
 
     def _process_onstable_callbacks(self):
@@ -191,11 +249,12 @@ class Simulator:
         Args:
             fn (function): The function we want to add to the queue.
         """
-        if fn not in self._change_queue:
-            logger.debug(f"Adding {fn.__qualname__} to queue.")
+        if fn not in self._change_queue_members:
+            logger.debug("Adding %s to queue.", fn.__qualname__)
             self._change_queue.append(fn)
+            self._change_queue_members.add(fn)
         else:
-            logger.debug(f"{fn.__qualname__} already in queue.")
+            logger.debug("%s already in queue.", fn.__qualname__)
 
     def get_cycles(self):
         """Returns the current number of cycles.
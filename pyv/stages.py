@@ -9,13 +9,26 @@ from pyv.log import logger
 from dataclasses import dataclass
 
 
-@dataclass
+# The pipeline payloads use slots so field reads in the hot per-cycle
+# paths (hazard unit, stages) are fixed-offset fetches instead of
+# __dict__ lookups.
+@dataclass(slots=True)
 class IFID_t:
     inst: int = 0
     pc: int = 0
+    # Pre-decoded hazard fields, filled in by the IF stage so the
+    # hazard unit reads them instead of re-extracting them every cycle
+    opcode: int = 0
+    rs1_idx: int = 0
+    rs2_idx: int = 0
+    needs_rs1: int = 0
+    needs_rs2: int = 0
+    is_valid: int = 0
+    """Whether `inst` has a valid 32-bit encoding (lowest two bits set).
+    Checked once at fetch instead of per hazard evaluation."""
 
 
-@dataclass
+@dataclass(slots=True)
 class IDEX_t:
     rs1: int = 0
     rs2: int = 0
@@ -31,9 +44,11 @@ class IDEX_t:
     csr_addr: int = 0
     csr_read_val: int = 0
     csr_write_en: bool = False
+    rs1_idx: int = 0
+    rs2_idx: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class EXMEM_t:
     rd: int = 0
     we: int = 0
@@ -50,7 +65,7 @@ class EXMEM_t:
     csr_write_val: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class MEMWB_t:
     rd: int = 0
     we: int = 0
@@ -67,6 +82,40 @@ class MEMWB_t:
 LOAD = 1
 STORE = 2
 
+# Canonical NOP (addi x0, x0, 0), used for reset values and bubbles
+NOP_INST = 0x00000013
+
+# Opcode values resolved once at import; the decode/execute paths
+# compare against these instead of looking up isa.OPCODES per call.
+_OPC_LOAD = isa.OPCODES["LOAD"]
+_OPC_OP_IMM = isa.OPCODES["OP-IMM"]
+_OPC_AUIPC = isa.OPCODES["AUIPC"]
+_OPC_STORE = isa.OPCODES["STORE"]
+_OPC_OP = isa.OPCODES["OP"]
+_OPC_LUI = isa.OPCODES["LUI"]
+_OPC_BRANCH = isa.OPCODES["BRANCH"]
+_OPC_JALR = isa.OPCODES["JALR"]
+_OPC_JAL = isa.OPCODES["JAL"]
+_OPC_SYSTEM = isa.OPCODES["SYSTEM"]
+_OPC_VALUES = frozenset(isa.OPCODES.values())
+
+# Source-register usage per opcode, built once at import. Indexed by the
+# 5-bit opcode, 1 where the instruction reads the respective register;
+# used to annotate IFID_t at fetch time for the hazard unit.
+_NEEDS_RS1 = bytearray(32)
+for _name in ("OP", "OP-IMM", "LOAD", "STORE", "BRANCH", "JALR"):
+    _NEEDS_RS1[isa.OPCODES[_name]] = 1
+
+_NEEDS_RS2 = bytearray(32)
+for _name in ("OP", "STORE", "BRANCH"):
+    _NEEDS_RS2[isa.OPCODES[_name]] = 1
+del _name
+
+# Forwarding selector codes (hazard unit -> EX stage operand muxes)
+FWD_NONE = 0
+FWD_EX_MEM = 1
+FWD_MEM_WB = 2
+
 
 class IFStage(Module):
     """Instruction Fetch Stage.
@@ -88,7 +137,7 @@ class IFStage(Module):
         self.pc_reg = Reg(int, -4)
 
         # Instruction register (IR)
-        self.ir_reg = Reg(int, 0x00000013)
+        self.ir_reg = Reg(int, NOP_INST)
 
         # Helper wires
         self.pc_reg_w = Wire(int, [self.write_output])
@@ -109,7 +158,13 @@ class IFStage(Module):
         self.pc_reg.next << self.npc_i
 
     def write_output(self):
-        self.IFID_o.write(IFID_t(self.ir_reg_w.read(), self.pc_reg_w.read()))
+        inst = self.ir_reg_w.read()
+        opcode = (inst >> 2) & 0x1F
+        self.IFID_o.write(IFID_t(
+            inst, self.pc_reg_w.read(), opcode,
+            (inst >> 15) & 0x1F, (inst >> 20) & 0x1F,
+            _NEEDS_RS1[opcode], _NEEDS_RS2[opcode],
+            (inst & 0x3) == 0x3))
 
 
 class IDStage(Module):
@@ -131,6 +186,11 @@ class IDStage(Module):
 
         # Inputs
         self.IFID_i = Input(IFID_t)
+        self.flush_i = Input(bool, [None])
+        """Flush indicator (pipelined model). When set, the instruction
+        currently in ID is a wrong-path fetch about to be squashed, so
+        no exception must be raised for it. Unconnected (always False)
+        in the single-cycle model."""
 
         # Outputs
         self.IDEX_o = Output(IDEX_t)
@@ -178,6 +238,9 @@ class IDStage(Module):
             self.dec_csr(inst, opcode, funct3, rd_idx, rs1_idx)
         if csr_is_imm:
             rs1 = csr_uimm
+            # The uimm is not a register operand: index 0 tells the EX
+            # stage to keep the latched value as-is.
+            rs1_idx = 0
 
         ecall = self.is_ecall(inst)
         mret = self.is_mret(inst)
@@ -185,12 +248,13 @@ class IDStage(Module):
         # Outputs
         self.IDEX_o.write(IDEX_t(
             rs1, rs2, imm, self.pc, rd_idx, we, wb_sel,
-            opcode, funct3, funct7, mem, csr_addr, csr_read_val, csr_write_en))
+            opcode, funct3, funct7, mem, csr_addr, csr_read_val, csr_write_en,
+            rs1_idx, rs2_idx))
         self.ecall_o.write(ecall)
         self.mret_o.write(mret)
 
     def is_csr(self, opcode, f3):
-        return opcode == isa.OPCODES["SYSTEM"] and f3 in isa.CSR_F3.values()
+        return opcode == _OPC_SYSTEM and f3 in isa.CSR_F3.values()
 
     def is_csr_imm(self, f3):
         return f3 in [
@@ -221,9 +285,9 @@ class IDStage(Module):
             A special value when the instruction is LOAD/STORE.
             0 otherwise.
         """
-        if opcode == isa.OPCODES['LOAD']:
+        if opcode == _OPC_LOAD:
             return LOAD
-        elif opcode == isa.OPCODES['STORE']:
+        elif opcode == _OPC_STORE:
             return STORE
         else:
             return 0
@@ -239,9 +303,9 @@ class IDStage(Module):
             * 2: LOAD instruction
             * 0: otherwise
         """
-        if opcode == isa.OPCODES['JAL']:
+        if opcode == _OPC_JAL:
             return 1
-        elif opcode == isa.OPCODES['LOAD']:
+        elif opcode == _OPC_LOAD:
             return 2
         elif self.is_csr(opcode, funct3):
             return 3
@@ -340,6 +404,11 @@ class IDStage(Module):
         return csr_addr, csr_read_val, csr_write_en, csr_is_imm, csr_uimm
 
     def check_exception(self):
+        if self.flush_i.read():
+            # Wrong-path instruction being squashed by a taken
+            # branch/jump: whatever was fetched must not raise.
+            return False
+
         inst, opcode, f3, f7 = self.check_exception_inputs
         illinst = False
 
@@ -347,10 +416,10 @@ class IDStage(Module):
         if (inst & 0x3) != 0x3:
             raise isa.IllegalInstructionException(self.pc, inst)
 
-        if opcode not in isa.OPCODES.values():
+        if opcode not in _OPC_VALUES:
             raise isa.IllegalInstructionException(self.pc, inst)
 
-        if opcode == isa.OPCODES['OP-IMM']:
+        if opcode == _OPC_OP_IMM:
             if f3 == 0b001 and f7 != 0:  # SLLI
                 raise isa.IllegalInstructionException(self.pc, inst)
                 illinst = True
@@ -358,7 +427,7 @@ class IDStage(Module):
                 raise isa.IllegalInstructionException(self.pc, inst)
                 illinst = True
 
-        if opcode == isa.OPCODES['OP']:
+        if opcode == _OPC_OP:
             if not (f7 == 0 or f7 == 0b0100000):
                 raise isa.IllegalInstructionException(self.pc, inst)
                 illinst = True
@@ -366,22 +435,22 @@ class IDStage(Module):
                 raise isa.IllegalInstructionException(self.pc, inst)
                 illinst = True
 
-        if opcode == isa.OPCODES['JALR']:
+        if opcode == _OPC_JALR:
             if f3 != 0:
                 raise isa.IllegalInstructionException(self.pc, inst)
                 illinst = True
 
-        if opcode == isa.OPCODES['BRANCH']:
+        if opcode == _OPC_BRANCH:
             if f3 == 2 or f3 == 3:
                 raise isa.IllegalInstructionException(self.pc, inst)
                 illinst = True
 
-        if opcode == isa.OPCODES['LOAD']:
+        if opcode == _OPC_LOAD:
             if f3 == 3 or f3 == 6 or f3 == 7:
                 raise isa.IllegalInstructionException(self.pc, inst)
                 illinst = True
 
-        if opcode == isa.OPCODES['STORE']:
+        if opcode == _OPC_STORE:
             if f3 > 2:
                 raise isa.IllegalInstructionException(self.pc, inst)
                 illinst = True  # noqa: F841
@@ -397,15 +466,37 @@ class EXStage(Module):
 
     Inputs:
         IDEX_i: Interface from IDStage.
+        fwd_a_i: Forwarding selector for operand A (pipelined model).
+        fwd_b_i: Forwarding selector for operand B (pipelined model).
+        fwd_a_val_i: Forwarded value for operand A.
+        fwd_b_val_i: Forwarded value for operand B.
 
     Outputs:
         EXMEM_o: Interface to MEMStage.
     """
-    def __init__(self):
+    def __init__(self, regf: Regfile = None):
+        """EX stage constructor.
+
+        Args:
+            regf: Register file for operand re-reads (pipelined model
+                only). When omitted, operands come solely from the
+                latched ID/EX values (single-cycle model).
+        """
         super().__init__()
+        self.regfile = regf
         self.IDEX_i = Input(
             IDEX_t, sensitive_methods=[self.process, self.pass_through])
 
+        # Forwarding controls (driven by the hazard unit in the
+        # pipelined model; left unconnected in the single-cycle model).
+        # The codes select between the regfile and a result tapped off
+        # the EX/MEM or MEM/WB pipeline register, carried on the *_val
+        # inputs.
+        self.fwd_a_i = Input(int, [self.process])
+        self.fwd_b_i = Input(int, [self.process])
+        self.fwd_a_val_i = Input(int, [self.process])
+        self.fwd_b_val_i = Input(int, [self.process])
+
         self.register_stable_callbacks([self.check_exception])
 
         self.EXMEM_o = Output(EXMEM_t)
@@ -433,7 +524,6 @@ class EXStage(Module):
         self.exmem_val.rd = val.rd
         self.exmem_val.we = val.we
         self.exmem_val.wb_sel = val.wb_sel
-        self.exmem_val.rs2 = val.rs2
         self.exmem_val.mem = val.mem
         self.exmem_val.funct3 = val.funct3
         self.exmem_val.csr_addr = val.csr_addr
@@ -442,12 +532,44 @@ class EXStage(Module):
 
         self.write_output()
 
+    def _resolve_operands(self, val: IDEX_t):
+        """Selects the source operand values (pipelined model only).
+
+        Precedence per source register: a result forwarded from the
+        EX/MEM or MEM/WB pipeline register when the hazard unit requests
+        it, otherwise a fresh regfile read -- the value latched in ID
+        may predate a write-back that has retired since. Index 0 keeps
+        the latched value: it covers x0 and the CSR uimm substituted by
+        the ID stage.
+
+        Returns:
+            Tuple of (rs1 value, rs2 value).
+        """
+        rs1 = val.rs1
+        if val.rs1_idx != 0:
+            if self.fwd_a_i.read() != FWD_NONE:
+                rs1 = self.fwd_a_val_i.read()
+            else:
+                rs1 = self.regfile.read(val.rs1_idx)
+
+        rs2 = val.rs2
+        if val.rs2_idx != 0:
+            if self.fwd_b_i.read() != FWD_NONE:
+                rs2 = self.fwd_b_val_i.read()
+            else:
+                rs2 = self.regfile.read(val.rs2_idx)
+
+        return rs1, rs2
+
     def process(self):
         # Read inputs
         val: IDEX_t = self.IDEX_i.read()
         opcode = val.opcode
-        rs1 = val.rs1
-        rs2 = val.rs2
+        if self.regfile is not None:
+            rs1, rs2 = self._resolve_operands(val)
+        else:
+            rs1 = val.rs1
+            rs2 = val.rs2
         imm = val.imm
         pc = val.pc
         f3 = val.funct3
@@ -457,9 +579,9 @@ class EXStage(Module):
 
         # Check for branch/jump
         take_branch = False
-        if opcode == isa.OPCODES['BRANCH']:
+        if opcode == _OPC_BRANCH:
             take_branch = self.branch(f3, rs1, rs2)
-        elif opcode == isa.OPCODES['JAL'] or opcode == isa.OPCODES['JALR']:
+        elif opcode == _OPC_JAL or opcode == _OPC_JALR:
             take_branch = True
 
         pc4 = pc + 4
@@ -479,6 +601,9 @@ class EXStage(Module):
         self.exmem_val.take_branch = take_branch
         self.exmem_val.pc4 = pc4
         self.exmem_val.alu_res = alu_res
+        # rs2 is forwarded here (not in pass_through) so stores see the
+        # resolved value
+        self.exmem_val.rs2 = rs2
         self.exmem_val.csr_write_val = csr_write_val
         self.write_output()
 
@@ -606,34 +731,34 @@ class EXStage(Module):
         # Select operands
         op1 = op2 = 0
         # op1
-        if (opcode == isa.OPCODES['AUIPC']
-                or opcode == isa.OPCODES['JAL']
-                or opcode == isa.OPCODES['BRANCH']):
+        if (opcode == _OPC_AUIPC
+                or opcode == _OPC_JAL
+                or opcode == _OPC_BRANCH):
             op1 = pc
         else:
             op1 = rs1
         # op2
-        if opcode != isa.OPCODES['OP']:
+        if opcode != _OPC_OP:
             op2 = imm
         else:
             op2 = rs2
 
         # Perform ALU op
         alu_res = 0
-        if opcode == isa.OPCODES['LUI']:
+        if opcode == _OPC_LUI:
             alu_res = op2
 
-        elif (opcode == isa.OPCODES['AUIPC']
-              or opcode == isa.OPCODES['JAL']
-              or opcode == isa.OPCODES['BRANCH']
-              or opcode == isa.OPCODES['LOAD']
-              or opcode == isa.OPCODES['STORE']):
+        elif (opcode == _OPC_AUIPC
+              or opcode == _OPC_JAL
+              or opcode == _OPC_BRANCH
+              or opcode == _OPC_LOAD
+              or opcode == _OPC_STORE):
             alu_res = op1 + op2
 
-        elif opcode == isa.OPCODES['JALR']:
+        elif opcode == _OPC_JALR:
             alu_res = 0xfffffffe & (op1 + op2)
 
-        elif opcode == isa.OPCODES['OP-IMM']:
+        elif opcode == _OPC_OP_IMM:
             if f3 == 0b000:  # ADDI
                 alu_res = op1 + op2
             elif f3 == 0b010:  # SLTI
@@ -657,7 +782,7 @@ class EXStage(Module):
                 elif f7 == 0b0100000:  # SRAI
                     alu_res = _sra(op1, op2)
 
-        elif opcode == isa.OPCODES['OP']:
+        elif opcode == _OPC_OP:
             if f7 == 0:
                 if f3 == 0b000:  # ADD
                     alu_res = op1 + op2
@@ -854,10 +979,10 @@ class MEMStage(Module):
 
         if f3 == 1:  # Half word
             if addr & 0x1 != 0:
-                logger.warning(f"Misaligned {op_str} address 0x{addr:08X}.")
+                logger.warning("Misaligned %s address 0x%08X.", op_str, addr)
         elif f3 == 2:  # Word
             if addr & 0x11 != 0:
-                logger.warning(f"Misaligned {op_str} address 0x{addr:08X}.")
+                logger.warning("Misaligned %s address 0x%08X.", op_str, addr)
 
 
 class WBStage(Module):